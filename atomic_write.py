@@ -0,0 +1,56 @@
+"""
+Crash-safe file writes shared by convert_doc.py and the notebook patch engine.
+"""
+import filecmp
+import os
+import shutil
+import tempfile
+
+def atomic_write(path, write, binary=False, skip_unchanged=True):
+    """
+    Calls write(f) with a temporary file in the same folder as path, fsyncs it, then
+    renames it over path. Whatever happens during the write, path holds either the old
+    contents or the new ones, never a truncated file.
+
+    With skip_unchanged, a result identical to the existing file is thrown away so the
+    file (and its modification time) is left alone. Returns True if path was replaced.
+    """
+    path = os.path.abspath(path)
+    folder = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "wb" if binary else "w", **({} if binary else {"encoding": "utf-8"})) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        if skip_unchanged and os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+            os.remove(tmp_path)
+            return False
+
+        # mkstemp creates the file readable only by its owner; keep the usual permissions
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    # Make the rename itself durable (not supported on Windows)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return True
+
+def atomic_copy(src, dst):
+    """Copies src over dst with atomic_write(). Returns True if dst was replaced."""
+    with open(src, "rb") as f:
+        return atomic_write(dst, lambda out: shutil.copyfileobj(f, out), binary=True)
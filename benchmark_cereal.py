@@ -0,0 +1,59 @@
+import ast
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from template_registry import read_template, template_path
+
+TEMPLATE = "expand_ch11_cereal_widget/cereal_box_simulator"
+
+# Peak memory allowed for one run of simulate_collections, whatever the probabilities
+MEMORY_BUDGET_MB = 64
+
+CONFIGS = [
+    ("Default (3 athletes)", [0.2, 0.3, 0.5]),
+    ("10 athletes, one at 1%", [0.01] + [0.11] * 9),
+    ("Two pictures at 99.9% / 0.1%", [0.999, 0.001]),
+]
+
+def load_simulation():
+    """
+    Loads simulate_collections() from the cereal widget template without running the rest
+    of it, which needs ipywidgets and a notebook to display in.
+    """
+    tree = ast.parse(read_template(TEMPLATE))
+    keep = [node for node in tree.body
+            if isinstance(node, ast.FunctionDef) and node.name == "simulate_collections"
+            or isinstance(node, ast.Assign) and node.targets[0].id == "MAX_BOXES_PER_DRAW"]
+    namespace = {"np": np}
+    exec(compile(ast.Module(keep, type_ignores=[]), template_path(TEMPLATE), "exec"), namespace)
+    return namespace["simulate_collections"]
+
+def run_benchmark(n_trials=100_000):
+    """
+    Times the widget's "simulate many classes" run for normal and very skewed pictures and
+    checks each stays under MEMORY_BUDGET_MB. Returns the number of configs over budget.
+    """
+    simulate_collections = load_simulation()
+    over_budget = 0
+    print(f"{'Config':<32} {'Time':>8} {'Peak memory':>12} {'Mean boxes':>11}")
+    print("-" * 66)
+    for label, probs in CONFIGS:
+        rng = np.random.default_rng(0)
+        tracemalloc.start()
+        start = time.perf_counter()
+        boxes = simulate_collections(probs, n_trials, rng)
+        elapsed = time.perf_counter() - start
+        peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        status = "" if peak_mb <= MEMORY_BUDGET_MB else "  OVER BUDGET"
+        over_budget += bool(status)
+        print(f"{label:<32} {elapsed:>7.2f}s {peak_mb:>9.1f} MB {boxes.mean():>11.1f}{status}")
+    print("-" * 66)
+    print(f"{n_trials} trials per config, memory budget {MEMORY_BUDGET_MB} MB")
+    return over_budget
+
+if __name__ == "__main__":
+    sys.exit(1 if run_benchmark(*map(int, sys.argv[1:2])) else 0)
@@ -0,0 +1,112 @@
+import os
+import re
+import sys
+import time
+
+from convert_doc import IMAGE_PLACEHOLDER, MarkdownRewriter
+
+def legacy_rewrite(md_content, embed_image):
+    """
+    The original chain of four full-document re.sub passes from convert_doc.py, kept here
+    as the baseline for the benchmark.
+    """
+    def md_image_replacer(match):
+        return embed_image(match.group(2))
+
+    processed_content = re.sub(r'!\[(.*?)\]\((.*?)\)', md_image_replacer, md_content)
+
+    def html_image_replacer(match):
+        if match.group(1).startswith("data:"):
+            return match.group(0)
+        return embed_image(match.group(1))
+
+    processed_content = re.sub(r'<img src="(.*?)"(?:.*?)/>', html_image_replacer, processed_content)
+
+    processed_content = re.sub(r'\{width=.*?\}', '', processed_content)
+
+    def span_replacer(match):
+        text = match.group(1)
+        attrs = match.group(2)
+        if 'underline' in attrs:
+            return f'<u>{text}</u>'
+        return text
+
+    return re.sub(r'\[(.*?)\]\{(.*?)\}', span_replacer, processed_content)
+
+def markdown_from_notebook(notebook_path):
+    """
+    Rebuilds Pandoc-style markdown from a converted notebook: embedded images go back to
+    media paths with {width=...} attributes and <u> tags go back to [text]{.underline}.
+    Returns the markdown and a dict of media path -> the original inline <img> tag.
+    """
+    import nbformat
+    with open(notebook_path, 'r', encoding='utf-8') as f:
+        nb = nbformat.read(f, as_version=4)
+
+    inline_tags = {}
+    def unembed(match):
+        path = f"media/image{len(inline_tags) + 1}.png"
+        inline_tags[path] = match.group(0)
+        return f'![]({path}){{width="6.5in" height="3.2in"}}'
+
+    parts = []
+    for cell in nb.cells:
+        if cell.cell_type != 'markdown':
+            continue
+        source = re.sub(r'<img src="data:[^"]*"[^>]*/>', unembed, cell.source)
+        source = re.sub(r'<u>(.*?)</u>', r'[\1]{.underline}', source)
+        parts.append(source)
+    return "\n\n".join(parts), inline_tags
+
+def best_time(func, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def run_benchmark(path, repeats=20):
+    if path.endswith(".ipynb"):
+        md_content, inline_tags = markdown_from_notebook(path)
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            md_content = f.read()
+        inline_tags = {}
+
+    # Image encoding is precomputed so only the rewriting is timed. Both sides get the
+    # same tag convert_doc.py emits, whose base64 payload is a placeholder streamed in later.
+    def placeholder_tag(img_path):
+        return f'<img src="data:image/png;base64,{IMAGE_PLACEHOLDER.format(0)}" alt="" style="max-width:100%; height:auto;" />'
+
+    # The original code embedded full base64 tags before its cleanup passes, so those
+    # passes rescanned the image data
+    def inline_tag(img_path):
+        return inline_tags.get(img_path) or placeholder_tag(img_path)
+
+    rewriter = MarkdownRewriter(placeholder_tag)
+    # Silence the "Found ... image" logging while timing
+    real_stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+    try:
+        chain_time, chain_out = best_time(lambda: legacy_rewrite(md_content, placeholder_tag), repeats)
+        single_time, single_out = best_time(lambda: rewriter.rewrite(md_content), repeats)
+        inline_time, _ = best_time(lambda: legacy_rewrite(md_content, inline_tag), repeats)
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+
+    print(f"Input: {path} ({len(md_content) / 1024:.0f} KB of markdown, {len(inline_tags)} images)")
+    print(f"Chained re.sub passes: {chain_time * 1000:8.2f} ms")
+    print(f"Single-pass rewriter:  {single_time * 1000:8.2f} ms")
+    print(f"Rewriter vs. chain on the same input: {chain_time / single_time:.2f}x (best of {repeats})")
+    print(f"Outputs identical to the chain: {chain_out == single_out}")
+    print()
+    # Not a property of the rewriter: the saving comes from streaming images in as placeholders
+    print(f"For reference, the chain with full base64 tags inline (the original code, which "
+          f"rescanned the image data): {inline_time * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_benchmark(sys.argv[1])
+    else:
+        print("Usage: python3 benchmark_rewrite.py <markdown.md | notebook.ipynb>")
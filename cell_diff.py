@@ -0,0 +1,136 @@
+"""
+Structural diff between two versions of a notebook's cell list.
+
+snapshot(nb) records the cells before patching; diff_cells(snapshot, nb) afterwards works
+out the insert/update/move/delete operations that turn one into the other. Cells are matched
+by identity first (patches usually edit cells in place), then by content, so a patch
+that rebuilds an identical cell doesn't count as a change, and finally by position, so a
+cell swapped for a new one in the same place counts as an update. A rebuilt cell takes
+over the id of the cell it matched, so cell ids stay stable from one run to the next.
+"""
+import json
+
+import nbformat
+
+def content_key(node):
+    """Serialized content of a cell (ignoring its random id) or of notebook metadata."""
+    return json.dumps({k: v for k, v in node.items() if k != "id"}, sort_keys=True)
+
+def snapshot(nb):
+    """
+    The notebook's cells and metadata as they are now. Holding the cell objects keeps
+    their ids from being reused by cells created later.
+    """
+    return {
+        "cells": [(cell, content_key(cell), cell.get("id")) for cell in nb.cells],
+        "metadata": content_key(nb.metadata),
+    }
+
+def longest_increasing_run(values):
+    """Indexes into values of one longest strictly increasing subsequence."""
+    tails = []  # tails[k]: index of the smallest tail of an increasing run of length k+1
+    parents = [-1] * len(values)
+    for i, value in enumerate(values):
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if values[tails[mid]] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo > 0:
+            parents[i] = tails[lo - 1]
+        if lo == len(tails):
+            tails.append(i)
+        else:
+            tails[lo] = i
+
+    run = []
+    i = tails[-1] if tails else -1
+    while i != -1:
+        run.append(i)
+        i = parents[i]
+    return set(run)
+
+def describe(cell):
+    first_line = cell.source.strip().split('\n', 1)[0] if cell.source.strip() else ""
+    if len(first_line) > 50:
+        first_line = first_line[:50] + "..."
+    return f"[{cell.cell_type}] {first_line}"
+
+def diff_cells(before, nb):
+    """
+    Compares a snapshot() with the notebook's current state. Returns a list of
+    (operation, index, description) tuples sorted by index, where operation is "insert",
+    "update", "move" or "delete" and index is the cell's position after the change (before
+    it, for deletes). A change to the notebook's own metadata comes last, as
+    ("metadata", -1, ""). An empty list means the notebook is unchanged.
+    """
+    old_cells = before["cells"]
+    old_positions = {id(cell): i for i, (cell, _, _) in enumerate(old_cells)}
+
+    # Pair each current cell with the cell it was, by identity...
+    matches = {}
+    used = set()
+    for new_pos, cell in enumerate(nb.cells):
+        old_pos = old_positions.get(id(cell))
+        if old_pos is not None and old_pos not in used:
+            matches[new_pos] = old_pos
+            used.add(old_pos)
+
+    # ...or failing that by identical content, for cells a patch rebuilt from scratch
+    unmatched_old = {}
+    for old_pos, (_, key, _) in enumerate(old_cells):
+        if old_pos not in used:
+            unmatched_old.setdefault(key, []).append(old_pos)
+    new_keys = {}
+    for new_pos, cell in enumerate(nb.cells):
+        if new_pos not in matches:
+            key = new_keys[new_pos] = content_key(cell)
+            if unmatched_old.get(key):
+                matches[new_pos] = unmatched_old[key].pop(0)
+                used.add(matches[new_pos])
+
+    # ...or by position: a new cell right after the cell that used to precede a removed one
+    for new_pos, cell in enumerate(nb.cells):
+        if new_pos not in matches:
+            old_pos = matches[new_pos - 1] + 1 if new_pos - 1 in matches else (0 if new_pos == 0 else None)
+            if (old_pos is not None and old_pos < len(old_cells) and old_pos not in used
+                    and old_cells[old_pos][0].cell_type == cell.cell_type):
+                matches[new_pos] = old_pos
+                used.add(old_pos)
+
+    ops = []
+    matched = sorted(matches)
+    in_order = longest_increasing_run([matches[new_pos] for new_pos in matched])
+    for rank, new_pos in enumerate(matched):
+        cell = nb.cells[new_pos]
+        old_pos = matches[new_pos]
+        old_id = old_cells[old_pos][2]
+        if old_id and "id" in cell and cell.id != old_id:
+            cell.id = old_id
+        key = new_keys.get(new_pos) or content_key(cell)
+        if key != old_cells[old_pos][1]:
+            ops.append(("update", new_pos, describe(cell)))
+        if rank not in in_order:
+            ops.append(("move", new_pos, f"{describe(cell)} (was cell {old_pos})"))
+    for new_pos, cell in enumerate(nb.cells):
+        if new_pos not in matches:
+            ops.append(("insert", new_pos, describe(cell)))
+    for old_pos, (_, key, _) in enumerate(old_cells):
+        if old_pos not in used:
+            # Describe the cell as it was; the object itself may have been edited since
+            ops.append(("delete", old_pos, describe(nbformat.from_dict(json.loads(key)))))
+
+    ops.sort(key=lambda op: op[1])
+    if content_key(nb.metadata) != before["metadata"]:
+        ops.append(("metadata", -1, ""))
+    return ops
+
+def print_diff(ops):
+    """Prints one line per operation from diff_cells()."""
+    for op, index, description in ops:
+        if op == "metadata":
+            print("  notebook metadata changed")
+        else:
+            print(f"  {op:<6} cell {index}: {description}")
@@ -4,110 +4,577 @@ import os
 import base64
 import re
 import json
+import glob
+import fnmatch
+import hashlib
+import shutil
+import tempfile
+import sys
+import threading
+import time
+import urllib.parse
+import urllib.request
+import zipfile
 from pathlib import Path
 
-def get_base64_image_tag(image_path, width="100%"):
+from atomic_write import atomic_write, atomic_copy
+from parallel_jobs import run_jobs
+
+try:
+    from PIL import Image
+except ImportError:
+    # Pillow is optional; without it images are embedded exactly as Pandoc extracted them
+    Image = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # watchdog is optional; without it --watch polls the .docx files for changes
+    FileSystemEventHandler = object
+    Observer = None
+
+# Pandoc options shared by every conversion (part of the build cache key)
+PANDOC_ARGS = ["-f", "docx", "-t", "gfm", "--wrap=none"]
+
+# The same options in the form `pandoc server` accepts them, and where --serve listens
+PANDOC_SERVER_OPTIONS = {"from": "docx", "to": "gfm", "wrap": "none"}
+PANDOC_SERVER_URL = "http://127.0.0.1:3030"
+
+CACHE_DIR = ".convert_cache"
+DEFAULT_CACHE_SIZE_MB = 500
+
+# Images are base64-encoded in chunks of this many bytes. It must be a multiple of 3 so
+# each chunk encodes without padding and the pieces concatenate into one valid payload.
+IMAGE_CHUNK_SIZE = 3 * 64 * 1024
+
+# Stand-in for an image's base64 payload inside its data: URI. write_notebook() swaps it
+# for the real data while streaming, so the payload never lives in memory as one string.
+IMAGE_PLACEHOLDER = "\ue000IMG:{}\ue001"
+IMAGE_PLACEHOLDER_JSON_RE = re.compile(r'\\ue000IMG:(\d+)\\ue001')
+
+# Options for the markdown -> notebook stage (part of the build cache key)
+DEFAULT_SETTINGS = {
+    # Image optimization (needs Pillow). Notebook columns display images at most ~1000px
+    # wide, so anything larger is downscaled. 0 disables downscaling.
+    "optimize_images": True,
+    "max_image_width": 1200,
+    # Re-encode photographic images as "webp" or "jpeg" (None keeps the original format)
+    "photo_format": None,
+    "photo_quality": 85,
+}
+
+def get_mime_type(image_path):
+    ext = Path(image_path).suffix.lower().replace('.', '')
+    if ext == 'jpg': ext = 'jpeg'
+    
+    # Determine strict MIME type for common formats to ensure browser compatibility
+    if ext == 'svg':
+        return 'image/svg+xml'
+    return f'image/{ext}'
+
+def write_base64_data(image_path, write):
+    """
+    Streams the base64 encoding of an image file to write(). The image is read and encoded
+    IMAGE_CHUNK_SIZE bytes at a time, so peak memory doesn't depend on the size of the image.
+    """
+    with open(image_path, "rb") as img_file:
+        for chunk in iter(lambda: img_file.read(IMAGE_CHUNK_SIZE), b""):
+            write(base64.b64encode(chunk).decode('ascii'))
+
+def image_digest(image_path):
+    """
+    Hashes an image's bytes, so identical images are optimized only once.
+    """
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as img_file:
+        for chunk in iter(lambda: img_file.read(IMAGE_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+def is_photo(img, ext):
+    """
+    Rough check for photographic images: JPEGs, or opaque images with too many distinct
+    colors to be a diagram or screenshot.
+    """
+    if ext in ('.jpg', '.jpeg'):
+        return True
+    if img.mode not in ('RGB', 'L'):
+        return False
+    return img.getcolors(maxcolors=4096) is None
+
+def optimize_image(image_path, out_dir, key, settings):
     """
-    Reads an image file and returns an HTML string with embedded base64 data.
+    Downscales an image to the display width and re-encodes it (losslessly for PNG, or as
+    WebP/JPEG for photos when settings["photo_format"] is set). The optimized copy is written
+    to out_dir and its path returned; the original path is returned when optimization is
+    disabled, unsupported, or wouldn't make the file smaller.
     """
-    if not os.path.exists(image_path):
-        print(f"Warning: Image not found at {image_path}")
-        return f"<b>Error: Image not found at {image_path}</b>"
+    ext = Path(image_path).suffix.lower()
+    if Image is None or not settings["optimize_images"] or ext not in ('.png', '.jpg', '.jpeg'):
+        return image_path
 
+    original_size = os.path.getsize(image_path)
     try:
-        with open(image_path, "rb") as img_file:
-            b64_data = base64.b64encode(img_file.read()).decode('utf-8')
+        with Image.open(image_path) as img:
+            img.load()
+            original_dims = img.size
+            if img.mode == 'P':
+                img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
 
-        ext = Path(image_path).suffix.lower().replace('.', '')
-        if ext == 'jpg': ext = 'jpeg'
-        
-        # Determine strict MIME type for common formats to ensure browser compatibility
-        if ext == 'svg':
-            mime_type = 'image/svg+xml'
-        else:
-            mime_type = f'image/{ext}'
+            max_width = settings["max_image_width"]
+            resized = bool(max_width) and img.width > max_width
+            if resized:
+                new_height = max(1, round(img.height * max_width / img.width))
+                img = img.resize((max_width, new_height), Image.LANCZOS)
 
-        html_tag = (
-            f'<img src="data:{mime_type};base64,{b64_data}" '
-            f'alt="{Path(image_path).name}" '
-            f'style="max-width:{width}; height:auto;" />'
-        )
-        return html_tag
+            photo_format = settings["photo_format"]
+            if photo_format and is_photo(img, ext):
+                out_ext = '.webp' if photo_format == 'webp' else '.jpg'
+            else:
+                out_ext = ext
+
+            # Only PNG re-encoding is lossless; leave a full-size JPEG alone
+            if out_ext == ext and ext != '.png' and not resized:
+                return image_path
+
+            os.makedirs(out_dir, exist_ok=True)
+            out_path = os.path.join(out_dir, key + out_ext)
+            if out_ext == '.png':
+                img.save(out_path, 'PNG', optimize=True)
+            elif out_ext == '.webp':
+                img.save(out_path, 'WEBP', quality=settings["photo_quality"], method=6)
+            else:
+                img.convert('RGB').save(out_path, 'JPEG', quality=settings["photo_quality"], optimize=True, progressive=True)
+            new_dims = img.size
     except Exception as e:
-        print(f"Error processing image {image_path}: {e}")
-        return f"<b>Error processing image {image_path}</b>"
+        print(f"Warning: Could not optimize {image_path}: {e}")
+        return image_path
 
-def convert_to_notebook(docx_path, output_notebook_path):
-    print(f"Converting {docx_path}...")
-    
-    # 1. Run Pandoc to convert docx to markdown and extract media
-    # We use a temporary markdown file
-    temp_md = "temp_output.md"
-    media_dir = "media_chapter_10"
-    
-    # Create media directory if it handles it differently or just let pandoc do it
-    if os.path.exists(media_dir):
-         # Optional: clean up old media? For now, let's just leave it or overwrite.
-         pass
-         
-    cmd = [
-        "pandoc",
-        docx_path,
-        "-f", "docx",
-        "-t", "gfm",
-        "--wrap=none",
-        f"--extract-media={media_dir}",
-        "-o", temp_md
-    ]
+    new_size = os.path.getsize(out_path)
+    if new_size >= original_size:
+        print(f"Image {Path(image_path).name}: kept original ({original_size / 1024:.0f} KB)")
+        os.remove(out_path)
+        return image_path
+
+    print(f"Image {Path(image_path).name}: {original_size / 1024:.0f} KB -> {new_size / 1024:.0f} KB "
+          f"({original_dims[0]}x{original_dims[1]} -> {new_dims[0]}x{new_dims[1]}{', ' + out_ext[1:] if out_ext != ext else ''})")
+    return out_path
+
+def write_notebook(notebook_json, images, f):
+    """
+    Writes notebook JSON to the open file f, expanding image placeholders by streaming
+    each image's base64 data straight into the output.
+    """
+    skeleton = json.dumps(notebook_json, indent=2)
+
+    pos = 0
+    for match in IMAGE_PLACEHOLDER_JSON_RE.finditer(skeleton):
+        f.write(skeleton[pos:match.start()])
+        # Base64 needs no escaping inside a JSON string
+        write_base64_data(images[int(match.group(1))], f.write)
+        pos = match.end()
+    f.write(skeleton[pos:])
+
+def stream_pandoc(docx_path, media_dir, cwd=None):
+    """
+    Runs Pandoc to convert a docx to GFM markdown (extracting media) and yields the markdown
+    line by line as it arrives on Pandoc's stdout, so no temporary markdown file is written.
+    """
+    cmd = ["pandoc", docx_path] + PANDOC_ARGS + [f"--extract-media={media_dir}"]
     
     print("Running Pandoc:", " ".join(cmd))
-    subprocess.run(cmd, check=True)
-    
-    # 2. Read the generated markdown
-    with open(temp_md, "r", encoding="utf-8") as f:
-        md_content = f.read()
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, cwd=cwd, encoding="utf-8") as proc:
+        try:
+            yield from proc.stdout
+        except BaseException:
+            # Don't leave Pandoc running if the caller stops reading early
+            proc.kill()
+            raise
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
 
-    # 3. Process the markdown to embed images
+def convert_with_server(docx_path, server_url, cwd, timeout=120):
+    """
+    Converts a docx with an already running `pandoc server`, which skips starting a new
+    Pandoc process. Returns the markdown as a list of lines, like stream_pandoc yields them.
+    The server has no file access, so it can't extract media itself; the images are copied
+    out of the docx (a zip file) into cwd at the media/ paths the markdown refers to.
+    """
+    with open(docx_path, "rb") as f:
+        payload = dict(PANDOC_SERVER_OPTIONS, text=base64.b64encode(f.read()).decode("ascii"))
+    request = urllib.request.Request(
+        server_url,
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json", "Accept": "application/json"},
+    )
+    print(f"Converting with Pandoc server at {server_url}")
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        result = json.load(response)
+
+    with zipfile.ZipFile(docx_path) as docx:
+        for name in docx.namelist():
+            if name.startswith("word/media/") and not name.endswith("/"):
+                target = os.path.join(cwd, name[len("word/"):])
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with docx.open(name) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+
+    return result["output"].splitlines(keepends=True)
+
+def run_pandoc(docx_path, media_dir, cwd, pandoc_server=None):
+    """
+    Returns Pandoc's markdown lines for a docx. Uses pandoc_server (a URL) when one is given
+    and reachable, and otherwise falls back to running the pandoc command.
+    """
+    if pandoc_server:
+        try:
+            return convert_with_server(docx_path, pandoc_server, cwd)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Pandoc server unavailable ({e}), running pandoc directly.")
+    return stream_pandoc(docx_path, media_dir, cwd=cwd)
+
+def serve_pandoc(server_url=PANDOC_SERVER_URL):
+    """
+    Runs `pandoc server` in the foreground so repeated conversions can reuse it via
+    --pandoc-server instead of starting Pandoc each time. Stop it with Ctrl+C.
+    """
+    port = urllib.parse.urlparse(server_url).port or 3030
+    cmd = ["pandoc", "server", f"--port={port}", "--timeout=120"]
+    print("Starting Pandoc server:", " ".join(cmd))
+    print(f"Convert with: python3 convert_doc.py --pandoc-server {server_url} <input.docx> <output.ipynb>")
+    try:
+        subprocess.run(cmd, check=True)
+    except KeyboardInterrupt:
+        print("Pandoc server stopped.")
+
+class ConversionCache:
+    """
+    Content-addressed build cache for convert_to_notebook.
+
+    Each entry is a folder named after a hash of the .docx bytes and the Pandoc arguments.
+    It holds the intermediate GFM (output.md), the extracted media, and one finished
+    notebook per converter-settings hash. Entries are evicted least-recently-used first
+    once the cache grows past max_bytes.
+    """
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=DEFAULT_CACHE_SIZE_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def entry_for(self, docx_path):
+        digest = hashlib.sha256()
+        with open(docx_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        digest.update(json.dumps(PANDOC_ARGS).encode("utf-8"))
+        return os.path.join(self.cache_dir, digest.hexdigest()[:32])
+
+    def notebook_path(self, entry, settings):
+        settings_key = hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(entry, f"{settings_key}.ipynb")
+
+    def store(self, entry, workspace, markdown):
+        """
+        Publishes a finished Pandoc run (its markdown and the media in the workspace) as a
+        cache entry. The entry is staged next to its final location and renamed into place,
+        so other jobs never see a half-written entry.
+
+        A published entry is never replaced, since other jobs may be reading its media or
+        writing their notebooks into it. If another job published the same entry first, its
+        copy (made from the same .docx bytes) is kept and this one is dropped.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".staging_", dir=self.cache_dir)
+        with open(os.path.join(staging, "output.md"), "w", encoding="utf-8") as f:
+            f.write(markdown)
+        media = os.path.join(workspace, "media")
+        if os.path.isdir(media):
+            shutil.copytree(media, os.path.join(staging, "media"))
+
+        try:
+            # Fails if the entry already exists, so a live entry is never swapped out
+            os.rename(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def in_entry(self, entry, error):
+        """
+        Whether an OSError is about a file inside entry, i.e. the entry was evicted (and
+        perhaps published again) by another process while this one was using it.
+        """
+        return bool(error.filename) and os.path.abspath(error.filename).startswith(os.path.abspath(entry) + os.sep)
+
+    def store_notebook(self, cached_nb, notebook_json, images):
+        """
+        Writes the notebook for one settings hash into its entry. atomic_write() gives every
+        writer its own temporary file in the entry, so jobs storing the same notebook at once
+        don't clash; the last rename wins and all of them are identical. Returns False,
+        caching nothing, if the entry has been evicted in the meantime.
+        """
+        try:
+            atomic_write(cached_nb, lambda f: write_notebook(notebook_json, images, f))
+        except FileNotFoundError as e:
+            if not self.in_entry(os.path.dirname(cached_nb), e):
+                raise
+            return False
+        return True
+
+    def touch(self, entry):
+        # The entry folder's mtime doubles as its "last used" time for eviction
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            # Evicted by another process since it was read; nothing left to mark
+            pass
+
+    def evict(self):
+        """
+        Removes least recently used entries until the cache fits in max_bytes.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            # Skip staging folders that another job is still filling
+            if name.startswith(".") or not os.path.isdir(entry):
+                continue
+            size = sum(
+                os.path.getsize(os.path.join(root, file_name))
+                for root, _, files in os.walk(entry)
+                for file_name in files
+            )
+            entries.append((os.path.getmtime(entry), size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            print(f"Evicting cache entry {entry} ({size / 1024:.0f} KB)")
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+def converter_settings(settings):
+    """
+    Settings that affect the markdown -> notebook stage. Hashing the converter source means
+    any edit to this script invalidates previously cached notebooks.
+    """
+    return dict(settings, converter=hashlib.sha256(Path(__file__).read_bytes()).hexdigest())
+
+def convert_cached(docx_path, output_notebook_path, cache, entry, workspace, force, settings, pandoc_server):
+    """
+    The cached part of convert_to_notebook: copies the finished notebook from the cache
+    entry, or rebuilds it from the entry's Pandoc output, or runs Pandoc and fills the entry.
+    Returns (changed, hit), where hit means the notebook was copied as it was.
+    """
+    cached_nb = cache.notebook_path(entry, converter_settings(settings))
+    cached_md = os.path.join(entry, "output.md")
+
+    if not force and os.path.exists(cached_nb):
+        changed = atomic_copy(cached_nb, output_notebook_path)
+        cache.touch(entry)
+        return changed, True
+
+    if not force and os.path.exists(cached_md):
+        print("Reusing cached Pandoc output.")
+        with open(cached_md, "r", encoding="utf-8") as f:
+            notebook_json, images = markdown_to_notebook(f, base_dir=entry, settings=settings, work_dir=workspace)
+    else:
+        # Keep a copy of the streamed markdown for the cache entry
+        md_lines = []
+        def tee(lines):
+            for line in lines:
+                md_lines.append(line)
+                yield line
+        notebook_json, images = markdown_to_notebook(tee(run_pandoc(docx_path, "media", workspace, pandoc_server)),
+                                                     base_dir=workspace, settings=settings)
+        cache.store(entry, workspace, "".join(md_lines))
+
+    # Images are streamed into the cached copy once, then the file is copied out
+    if cache.store_notebook(cached_nb, notebook_json, images):
+        changed = atomic_copy(cached_nb, output_notebook_path)
+        cache.touch(entry)
+    else:
+        print(f"Cache entry {entry} was evicted, writing the notebook without caching it.")
+        changed = atomic_write(output_notebook_path, lambda f: write_notebook(notebook_json, images, f))
+    return changed, False
+
+def convert_to_notebook(docx_path, output_notebook_path, cache=None, force=False, settings=None, pandoc_server=None):
+    print(f"Converting {docx_path}...")
+    settings = dict(DEFAULT_SETTINGS, **(settings or {}))
+    # Pandoc runs inside the workspace, so relative paths must be resolved first
+    docx_path = os.path.abspath(docx_path)
+
+    # Every conversion gets a private workspace for Pandoc's markdown and media, so
+    # conversions running side by side never touch each other's files. It is removed
+    # automatically, even if Pandoc or the image embedding fails.
+    with tempfile.TemporaryDirectory(prefix="convert_doc_") as workspace:
+        if cache is not None:
+            entry = cache.entry_for(docx_path)
+            try:
+                changed, hit = convert_cached(docx_path, output_notebook_path, cache, entry, workspace,
+                                              force, settings, pandoc_server)
+            except FileNotFoundError as e:
+                # Cache entries are shared, so another process may evict this one while it
+                # is being read. Anything else missing is a real error.
+                if not cache.in_entry(entry, e):
+                    raise
+                print(f"Cache entry {entry} was evicted, converting without the cache.")
+                cache = None
+            else:
+                if hit:
+                    print(f"Cache hit, unchanged: {output_notebook_path}{'' if changed else ' (file left as is)'}")
+                    return
+
+        if cache is None:
+            # 1. Run Pandoc to convert docx to markdown and extract media, building cells
+            # from its output as it streams in
+            md_lines = run_pandoc(docx_path, "media", workspace, pandoc_server)
+            notebook_json, images = markdown_to_notebook(md_lines, base_dir=workspace, settings=settings)
+            changed = atomic_write(output_notebook_path, lambda f: write_notebook(notebook_json, images, f))
+
+    if changed:
+        print(f"Created notebook: {output_notebook_path}")
+    else:
+        print(f"Notebook unchanged, not rewritten: {output_notebook_path}")
+
+# Rules for MarkdownRewriter, tried in this order at each position of the markdown.
+# Register new Pandoc artifacts with @rewrite_rule instead of adding another pass.
+REWRITE_RULES = []
+
+def rewrite_rule(pattern):
+    """
+    Registers handler(match, rewriter) -> replacement text for a regex pattern.
+    """
+    def register(handler):
+        REWRITE_RULES.append((handler.__name__, re.compile(pattern), handler))
+        return handler
+    return register
+
+@rewrite_rule(r'!\[(.*?)\]\((.*?)\)')
+def markdown_image(match, rewriter):
     # Pandoc markdown images look like: ![](path/to/image.png) or ![alt](path/to/image.png)
-    # Regex to find images: !\[(.*?)\]\((.*?)\)
-    
-    # Replace markdown images: ![alt](path)
-    def md_image_replacer(match):
-        img_path = match.group(2)
-        print(f"Found markdown image: {img_path}")
-        return get_base64_image_tag(img_path)
-    
-    processed_content = re.sub(r'!\[(.*?)\]\((.*?)\)', md_image_replacer, md_content)
+    img_path = match.group(2)
+    print(f"Found markdown image: {img_path}")
+    return rewriter.embed_image(img_path)
 
-    # Replace HTML images: <img src="path" ... />
-    def html_image_replacer(match):
-        img_path = match.group(1)
-        print(f"Found HTML image: {img_path}")
-        return get_base64_image_tag(img_path)
-    
-    processed_content = re.sub(r'<img src="(.*?)"(?:.*?)/>', html_image_replacer, processed_content)
+@rewrite_rule(r'<img src="(.*?)"(?:.*?)/>')
+def html_image(match, rewriter):
+    # HTML images: <img src="path" ... />
+    img_path = match.group(1)
+    print(f"Found HTML image: {img_path}")
+    return rewriter.embed_image(img_path)
 
-    # 3b. Clean up Pandoc artifacts
+@rewrite_rule(r'\{width=.*?\}')
+def dimension_attributes(match, rewriter):
     # Remove dimension attributes like {width="..." height="..."} that might appear after markdown images
-    processed_content = re.sub(r'\{width=.*?\}', '', processed_content)
-    
+    return ''
+
+@rewrite_rule(r'\[(.*?)\]\{(.*?)\}')
+def span(match, rewriter):
     # Remove spans like [Text]{.underline} -> <u>Text</u>
     # Or generically [Text]{...} -> Text (or handle specific classes)
-    def span_replacer(match):
-        text = match.group(1)
-        attrs = match.group(2)
-        if 'underline' in attrs:
-            return f'<u>{text}</u>'
-        return text
+    # The text can itself contain images or spans, so it's rewritten too
+    text = rewriter.rewrite(match.group(1))
+    attrs = match.group(2)
+    if 'underline' in attrs:
+        return f'<u>{text}</u>'
+    return text
+
+class RuleMatch:
+    """
+    A rule's view of a match from the combined regex: group(n) is the rule's own group n.
+    """
+    __slots__ = ('match', 'offset')
+
+    def __init__(self, match, offset):
+        self.match = match
+        self.offset = offset
+
+    def group(self, n=0):
+        return self.match.group(self.offset + n if n else 0)
 
-    processed_content = re.sub(r'\[(.*?)\]\{(.*?)\}', span_replacer, processed_content)
+class MarkdownRewriter:
+    """
+    Rewrites every REWRITE_RULES construct in one scan of the markdown. The rules are
+    combined into a single alternation regex and each match is dispatched to its rule's
+    handler; text between matches is copied through unchanged.
+    """
+    _compiled = None  # (rule count, combined regex, (handler, group offset) per marker group)
+
+    def __init__(self, embed_image):
+        self.embed_image = embed_image
+        if MarkdownRewriter._compiled is None or MarkdownRewriter._compiled[0] != len(REWRITE_RULES):
+            # Each branch ends in an empty marker group, so match.lastindex says which rule
+            # matched. Wrapping whole branches in groups instead would defeat re's fast
+            # literal-prefix search and make the scan slower than separate passes.
+            branches = []
+            rule_for_group = {}
+            group_count = 0
+            for _, regex, handler in REWRITE_RULES:
+                rule_for_group[group_count + regex.groups + 1] = (handler, group_count)
+                group_count += regex.groups + 1
+                branches.append(f"(?:{regex.pattern}())")
+            MarkdownRewriter._compiled = (len(REWRITE_RULES), re.compile("|".join(branches)), rule_for_group)
+        _, self.pattern, self.rule_for_group = MarkdownRewriter._compiled
+
+    def _replace(self, match):
+        handler, offset = self.rule_for_group[match.lastindex]
+        return handler(RuleMatch(match, offset), self)
+
+    def rewrite(self, text):
+        # One scan; re.sub copies the text between matches into its output buffer in C
+        return self.pattern.sub(self._replace, text)
+
+def markdown_to_notebook(md_content, base_dir=".", settings=None, work_dir=None):
+    """
+    Cleans up Pandoc artifacts and splits the markdown into notebook cells. md_content is
+    a string or any iterable of lines (e.g. a file or stream_pandoc()), which is processed
+    one line at a time as it is read.
+    Returns (notebook_json, images): each image becomes an <img> tag with a data: URI whose
+    base64 payload is a placeholder filled in by write_notebook(). Image paths are resolved relative to base_dir,
+    and optimized copies of the images are written under work_dir (default: base_dir).
+    """
+    settings = dict(DEFAULT_SETTINGS, **(settings or {}))
+
+    # 3. Process the markdown to embed images
+    images = []  # (optimized) image paths the placeholders index into
+    placeholders = {}  # image path -> (placeholder, path of the image to embed)
+    by_digest = {}
+    optimized_dir = os.path.join(work_dir or base_dir, "optimized")
+
+    def embed_image(img_path):
+        image_path = os.path.join(base_dir, img_path)
+        if not os.path.exists(image_path):
+            print(f"Warning: Image not found at {image_path}")
+            return f"<b>Error: Image not found at {image_path}</b>"
+        if image_path not in placeholders:
+            # Key by the original bytes so every copy of an image is optimized only once
+            key = image_digest(image_path)
+            if key not in by_digest:
+                images.append(optimize_image(image_path, optimized_dir, key, settings))
+                by_digest[key] = (IMAGE_PLACEHOLDER.format(len(images) - 1), images[-1])
+            placeholders[image_path] = by_digest[key]
+        placeholder, embed_path = placeholders[image_path]
+        return (
+            f'<img src="data:{get_mime_type(embed_path)};base64,{placeholder}" '
+            f'alt="{Path(image_path).name}" '
+            f'style="max-width:100%; height:auto;" />'
+        )
+    
+    # 3b. Rewrite images and clean up Pandoc artifacts in a single pass. None of the rules
+    # span lines, so each line can be rewritten as soon as it arrives.
+    rewriter = MarkdownRewriter(embed_image)
+    if isinstance(md_content, str):
+        md_content = md_content.splitlines()
 
     # 4. Create Notebook Structure
     cells = []
     
     current_cell_source = []
     
-    for line in processed_content.splitlines():
+    for line in md_content:
+        line = rewriter.rewrite(line.rstrip("\r\n"))
         # Heuristic for new cell:
         # 1. Line starts with # (Header)
         # 2. Line looks like a bold header: **Something** (and short)
@@ -166,30 +633,249 @@ def convert_to_notebook(docx_path, output_notebook_path):
         "nbformat_minor": 4
     }
 
-    with open(output_notebook_path, "w", encoding="utf-8") as f:
-        json.dump(notebook_json, f, indent=2)
+    return notebook_json, images
 
-    print(f"Created notebook: {output_notebook_path}")
-    
-    # Cleanup
-    if os.path.exists(temp_md):
-        os.remove(temp_md)
+def notebook_name_for(docx_path):
+    """
+    Derives an output notebook name from a .docx file name.
+    "Chapter 11 - Understanding Randomness (Guided Notes).docx" -> "Chapter_11.ipynb"
+    """
+    stem = Path(docx_path).stem
+    match = re.match(r'Chapter\s*(\d+)', stem, re.IGNORECASE)
+    if match:
+        return f"Chapter_{match.group(1)}.ipynb"
+    return re.sub(r'\W+', '_', stem).strip('_') + ".ipynb"
+
+# Chapter notebooks live next to this script, where the widget scripts expect them
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Seconds a .docx must stay unchanged before it is rebuilt. Word writes a document in
+# several steps when saving, so this waits for the save to finish.
+WATCH_DEBOUNCE_SECONDS = 1.0
+WATCH_POLL_SECONDS = 0.5
+
+def chapter_pipeline(docx_path, out_dir="."):
+    """
+    Returns (notebook path, widget patches) for a .docx. Chapters listed in
+    notebook_patches.CHAPTER_PIPELINES build into the repository folder where their
+    scripts expect them; any other document is converted into out_dir with no patches.
+    """
+    from notebook_patches import CHAPTER_PIPELINES
+
+    match = re.match(r'Chapter\s*(\d+)', Path(docx_path).stem, re.IGNORECASE)
+    if match and int(match.group(1)) in CHAPTER_PIPELINES:
+        notebook, patches = CHAPTER_PIPELINES[int(match.group(1))]
+        return os.path.join(SCRIPT_DIR, notebook), patches
+    return os.path.join(out_dir, notebook_name_for(docx_path)), []
+
+def rebuild_chapter(docx_path, out_dir=".", cache=None, settings=None, pandoc_server=None):
+    """
+    Converts one .docx and re-applies its chapter's widget patches. Errors are printed
+    rather than raised so a watch session survives a bad save.
+    """
+    notebook, patches = chapter_pipeline(docx_path, out_dir)
+    start = time.perf_counter()
+    try:
+        convert_to_notebook(docx_path, notebook, cache=cache, settings=settings, pandoc_server=pandoc_server)
+        if patches:
+            # A fresh process picks up any edits to the widget scripts since the last rebuild
+            subprocess.run([sys.executable, "notebook_patches.py", notebook] + patches, cwd=SCRIPT_DIR, check=True)
+    except Exception as e:
+        print(f"Rebuild of {notebook} FAILED: {e}")
+        return
+    print(f"Rebuilt {notebook} in {time.perf_counter() - start:.2f}s")
+
+class DocxChangeHandler(FileSystemEventHandler):
+    """
+    Records when a watched .docx was last touched. Word's lock files ("~$name.docx") and
+    other temporary files are ignored.
+    """
+    def __init__(self, is_watched):
+        self.is_watched = is_watched
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def mark(self, path):
+        path = os.path.abspath(path)
+        if not os.path.basename(path).startswith("~$") and self.is_watched(path):
+            with self.lock:
+                self.pending[path] = time.monotonic()
+
+    def on_any_event(self, event):
+        # Only writes count: reading the .docx during a rebuild also raises events
+        if not event.is_directory and event.event_type in ("created", "modified", "moved", "closed"):
+            self.mark(event.src_path)
+            # Word saves by writing a temporary file and renaming it over the document
+            if getattr(event, "dest_path", None):
+                self.mark(event.dest_path)
+
+    def take_ready(self):
+        """Returns the paths that have been quiet for WATCH_DEBOUNCE_SECONDS."""
+        now = time.monotonic()
+        with self.lock:
+            ready = [p for p, t in self.pending.items() if now - t >= WATCH_DEBOUNCE_SECONDS]
+            for path in ready:
+                del self.pending[path]
+        return sorted(ready)
+
+def watch(patterns, out_dir=".", cache=None, settings=None, pandoc_server=None):
+    """
+    Watches .docx files matching the glob patterns and rebuilds a chapter (conversion plus
+    its widget scripts) shortly after its document is saved. Uses filesystem notifications
+    when watchdog is installed and polls modification times otherwise. Stop with Ctrl+C.
+    """
+    patterns = [os.path.abspath(p) for p in patterns]
+    def is_watched(path):
+        return any(fnmatch.fnmatch(path, p) for p in patterns)
+
+    handler = DocxChangeHandler(is_watched)
+    folders = sorted({os.path.dirname(p) for p in patterns})
+    observer = None
+    if Observer is not None:
+        observer = Observer()
+        for folder in folders:
+            observer.schedule(handler, folder, recursive=False)
+        observer.start()
+        print(f"Watching {', '.join(patterns)} for changes (Ctrl+C to stop)...")
+    else:
+        print(f"Watching {', '.join(patterns)} by polling (pip install watchdog for file notifications)...")
+
+    def snapshot():
+        return {p: os.stat(p).st_mtime_ns for pattern in patterns for p in glob.glob(pattern) if os.path.isfile(p)}
+
+    mtimes = snapshot()
+    try:
+        while True:
+            time.sleep(WATCH_POLL_SECONDS)
+            if observer is None:
+                current = snapshot()
+                for path, mtime in current.items():
+                    if mtimes.get(path) != mtime:
+                        handler.mark(path)
+                mtimes = current
+            for path in handler.take_ready():
+                if os.path.exists(path):
+                    print(f"\nChange detected: {path}")
+                    rebuild_chapter(path, out_dir, cache, settings, pandoc_server)
+                    if cache is not None:
+                        cache.evict()
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        if observer is not None:
+            observer.stop()
+            observer.join()
+
+def load_batch_jobs(sources, out_dir="."):
+    """
+    Expands a list of manifests and/or glob patterns into (docx, notebook) pairs.
+
+    A manifest is a .json file holding a list of entries like
+        {"docx": "../curriculumNotes/Chapter 11.docx", "notebook": "Chapter_11.ipynb"}
+    with paths relative to the manifest itself. Anything else is treated as a glob
+    of .docx files whose notebook names come from notebook_name_for().
+    """
+    jobs = []
+    for source in sources:
+        if source.endswith(".json"):
+            base = Path(source).parent
+            with open(source, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            for entry in entries:
+                docx = base / entry["docx"]
+                notebook = base / entry.get("notebook", notebook_name_for(docx))
+                jobs.append((str(docx.resolve()), str(notebook)))
+        else:
+            matches = sorted(glob.glob(source))
+            if not matches:
+                print(f"Warning: No .docx files match {source}")
+            for docx in matches:
+                jobs.append((os.path.abspath(docx), os.path.join(out_dir, notebook_name_for(docx))))
+
+    # Drop duplicates (e.g. overlapping globs) but keep the original order
+    seen = set()
+    unique_jobs = []
+    for job in jobs:
+        if job[1] not in seen:
+            seen.add(job[1])
+            unique_jobs.append(job)
+    return unique_jobs
+
+def _run_batch_job(docx_path, output_notebook_path, cache=None, force=False, settings=None, pandoc_server=None):
+    convert_to_notebook(docx_path, output_notebook_path, cache=cache, force=force, settings=settings,
+                        pandoc_server=pandoc_server)
+
+def convert_batch(jobs, max_workers=None, cache=None, force=False, settings=None, pandoc_server=None):
+    """
+    Converts many (docx, notebook) pairs in parallel on a bounded process pool.
+    Prints each job's log as it finishes, then per-file timings plus a summary, and
+    returns the number of failures.
+    """
+    if not jobs:
+        print("Nothing to convert.")
+        return 0
+
+    max_workers = max_workers or min(len(jobs), os.cpu_count() or 1)
+    print(f"Converting {len(jobs)} documents with {max_workers} workers...")
+
+    for _, notebook in jobs:
+        os.makedirs(os.path.dirname(os.path.abspath(notebook)), exist_ok=True)
+
+    # Evict once at the end rather than from inside workers that may still be filling entries
+    evict = cache.evict if cache is not None else None
+    return run_jobs([(notebook, _run_batch_job, (docx, notebook, cache, force, settings, pandoc_server))
+                     for docx, notebook in jobs],
+                    max_workers, "Batch Summary", "Converted", before_summary=evict)
 
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Convert docx to ipynb with embedded images.")
     parser.add_argument("docx_file", nargs='?', help="Path to input docx file")
     parser.add_argument("output_nb", nargs='?', help="Path to output ipynb file")
+    parser.add_argument("--batch", nargs='+', metavar="SOURCE", help="Manifest (.json) or glob of .docx files to convert in parallel")
+    parser.add_argument("--watch", nargs='+', metavar="GLOB", help="Rebuild a chapter and re-apply its widget patches whenever its .docx is saved")
+    parser.add_argument("--out-dir", default=".", help="Output folder for notebooks found by --batch globs")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Number of parallel workers for --batch (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Ignore cached results and rebuild everything")
+    parser.add_argument("--no-cache", action="store_true", help="Don't read or write the build cache")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help=f"Build cache folder (default: {CACHE_DIR})")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE_MB, help=f"Build cache size limit in MB (default: {DEFAULT_CACHE_SIZE_MB})")
+    parser.add_argument("--serve", action="store_true", help=f"Run a Pandoc server for --pandoc-server to use (at {PANDOC_SERVER_URL})")
+    parser.add_argument("--pandoc-server", nargs='?', const=PANDOC_SERVER_URL, default=None, metavar="URL",
+                        help=f"Convert with a running Pandoc server (default URL: {PANDOC_SERVER_URL}), falling back to the pandoc command")
+    
+    parser.add_argument("--no-optimize-images", action="store_true", help="Embed images exactly as extracted (skip downscaling and re-encoding)")
+    parser.add_argument("--max-image-width", type=int, default=DEFAULT_SETTINGS["max_image_width"], help="Downscale images wider than this many pixels (0 = never)")
+    parser.add_argument("--photo-format", choices=["webp", "jpeg"], default=None, help="Re-encode photographic images in this format")
     
     args = parser.parse_args()
+    cache = None if args.no_cache else ConversionCache(args.cache_dir, args.cache_size * 1024 * 1024)
+    settings = {
+        "optimize_images": not args.no_optimize_images,
+        "max_image_width": args.max_image_width,
+        "photo_format": args.photo_format,
+    }
+    if Image is None and settings["optimize_images"]:
+        print("Note: Pillow is not installed, so images are embedded without optimization (pip install pillow).")
 
-    if args.docx_file and args.output_nb:
+    if args.serve:
+        serve_pandoc(args.pandoc_server or PANDOC_SERVER_URL)
+    elif args.watch:
+        watch(args.watch, args.out_dir, cache, settings, args.pandoc_server)
+    elif args.batch:
+        jobs = load_batch_jobs(args.batch, args.out_dir)
+        sys.exit(1 if convert_batch(jobs, args.jobs, cache, args.force, settings, args.pandoc_server) else 0)
+    elif args.docx_file and args.output_nb:
         # Command line arguments provided
         full_docx_path = os.path.abspath(args.docx_file)
-        convert_to_notebook(full_docx_path, args.output_nb)
+        convert_to_notebook(full_docx_path, args.output_nb, cache=cache, force=args.force, settings=settings,
+                            pandoc_server=args.pandoc_server)
+        if cache is not None:
+            cache.evict()
     else:
         # Default behavior (useful for quick testing or if run without args)
         print("No arguments provided. Usage: python convert_doc.py <input.docx> <output.ipynb>")
+        print("       python convert_doc.py --batch <manifest.json | \"glob/*.docx\"> [-j N]")
         # Example default, can be removed or kept as fallback
         # docx_file = "../curriculumNotesFromBob/Chapter 11 - Understanding Randomness (Guided Notes).docx"
         # output_nb = "Chapter_11.ipynb"
@@ -1,17 +1,8 @@
-import nbformat
-import os
 import textwrap
+from notebook_patches import notebook_patch, apply_patches
 
-def fix_indentation():
-    nb_path = 'Chapter_11.ipynb'
-    if not os.path.exists(nb_path):
-        print(f"Error: {nb_path} not found.")
-        return
-
-    print(f"Reading {nb_path}...")
-    with open(nb_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
-
+@notebook_patch
+def fix_indentation(nb):
     # Find the cell with the Phillies HTML content
     target_idx = -1
     for i, cell in enumerate(nb.cells):
@@ -53,10 +44,5 @@ def fix_indentation():
             
     nb.cells[target_idx].source = "\n".join(cleaned_lines)
 
-    print(f"Saving to {nb_path}...")
-    with open(nb_path, 'w', encoding='utf-8') as f:
-        nbformat.write(nb, f)
-    print("Done!")
-
 if __name__ == "__main__":
-    fix_indentation()
+    apply_patches('Chapter_11.ipynb', ['fix_phillies_indentation'])
@@ -1,10 +1,7 @@
-import nbformat
-
-def fix_syntax():
-    nb_path = 'Chapter_10_updated.ipynb'
-    with open(nb_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
+from notebook_patches import notebook_patch, apply_patches
 
+@notebook_patch
+def fix_syntax(nb):
     target_code = "plot_simpson"
     
     fixed_count = 0
@@ -21,11 +18,9 @@ def fix_syntax():
                 fixed_count += 1
 
     if fixed_count > 0:
-        with open(nb_path, 'w', encoding='utf-8') as f:
-            nbformat.write(nb, f)
         print(f"Fixed {fixed_count} syntax errors in notebook.")
     else:
         print("No syntax errors found or already fixed.")
 
 if __name__ == "__main__":
-    fix_syntax()
+    apply_patches('Chapter_10_updated.ipynb', ['fix_syntax_error'])
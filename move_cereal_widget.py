@@ -1,38 +1,26 @@
-import nbformat
-import os
-
-def move_widget():
-    nb_path = 'Chapter_11.ipynb'
-    if not os.path.exists(nb_path):
-        print(f"Error: {nb_path} not found.")
-        return
-
-    print(f"Reading {nb_path}...")
-    with open(nb_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
+from notebook_patches import notebook_patch, apply_patches, cell_index
 
+@notebook_patch
+def move_widget(nb):
     # 1. Find and remove the misplaced widget cells
     # They are likely defined by the markdown header "Interactive Cereal Box Simulator" 
     # and the code cell containing "class CerealBoxSimulator"
     
+    index = cell_index(nb)
     cells_to_move = []
-    indices_to_remove = []
-    
-    for i, cell in enumerate(nb.cells):
-        if cell.cell_type == 'markdown' and "Interactive Cereal Box Simulator" in cell.source:
-            indices_to_remove.append(i)
-            cells_to_move.append(cell)
-        elif cell.cell_type == 'code' and "class CerealBoxSimulator" in cell.source:
-            indices_to_remove.append(i)
-            cells_to_move.append(cell)
+    header_idx = index.heading("Interactive Cereal Box Simulator")
+    if header_idx != -1:
+        cells_to_move.append(nb.cells[header_idx])
+    code_idx = index.widget("cereal-box-simulator", "class CerealBoxSimulator")
+    if code_idx != -1:
+        cells_to_move.append(nb.cells[code_idx])
             
     if not cells_to_move:
         print("Could not find widget cells to move. They might not exist or title changed.")
         return
 
-    # Remove in reverse order to maintain indices during deletion
-    for i in sorted(indices_to_remove, reverse=True):
-        del nb.cells[i]
+    # Remove by identity, so the positions of the other cells don't matter
+    nb.cells[:] = [cell for cell in nb.cells if not any(cell is c for c in cells_to_move)]
         
     print(f"Removed {len(cells_to_move)} cells.")
 
@@ -63,10 +51,5 @@ def move_widget():
     for cell in reversed(cells_to_move): # Insert in reverse order at same index to push down
         nb.cells.insert(target_idx, cell)
 
-    print(f"Saving to {nb_path}...")
-    with open(nb_path, 'w', encoding='utf-8') as f:
-        nbformat.write(nb, f)
-    print("Done!")
-
 if __name__ == "__main__":
-    move_widget()
+    apply_patches('Chapter_11.ipynb', ['move_cereal_widget'])
@@ -1,12 +1,8 @@
 
-import nbformat
+from notebook_patches import notebook_patch, apply_patches
 
-def main():
-    nb_path = "Chapter_10_updated.ipynb"
-    
-    with open(nb_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
-        
+@notebook_patch
+def move_confounding_cells(nb):
     confounding_cells = []
     other_cells = []
     
@@ -43,11 +39,8 @@ def main():
     final_cells = other_cells + confounding_cells
     
     nb.cells = final_cells
-    
-    with open(nb_path, 'w', encoding='utf-8') as f:
-        nbformat.write(nb, f)
         
     print(f"Moved {len(confounding_cells)} Confounding Variable cells to the end of the notebook.")
 
 if __name__ == "__main__":
-    main()
+    apply_patches("Chapter_10_updated.ipynb", ["move_widget"])
@@ -0,0 +1,585 @@
+"""
+Patch engine for the widget scripts.
+
+Each widget script registers the function that edits its notebook with @notebook_patch.
+apply_patches() reads a notebook once, runs any number of patches in order against that
+single in-memory copy, and writes the result once. If a patch fails, nothing is written,
+so a notebook is never left half-patched. Reading skips nbformat's schema validation;
+the finished notebook is validated once, just before it is saved.
+
+Every cell a patch inserts or rewrites is stamped with the patch's name and a hash of its
+content (cell.metadata["patch"]), and the notebook records a fingerprint of each patch
+it has been through (nb.metadata["patches"]). A patch whose fingerprint is already
+recorded is skipped, so re-running a pipeline on an up-to-date notebook does nothing.
+A cell a patch inserts that the notebook already has, such as a widget added before
+cells were stamped, is matched to the existing cell rather than added twice (adopt_cells).
+
+Patches locate their insertion points with cell_index(nb), which finds cells by a stable
+anchor ID kept in the cell's metadata or by heading text. The index reads a cell's source
+again only when it has changed. Lookups that fall back to a substring search
+(CellIndex.find) still scan the whole notebook.
+
+Widget code comes from widget_templates/<patch>/*.py via widget_template(); every template
+a pipeline uses is compiled before its notebook is read.
+
+patch_manifest.json declares each chapter's notebook, its patches, and which patches must
+run before which. A chapter's patches run in dependency order, and a patch also re-runs
+when one of its prerequisites changed. --build runs several chapters in parallel.
+
+Usage:
+    python3 notebook_patches.py --chapter 11 [--force]
+    python3 notebook_patches.py --build [11 12 ...] [--jobs N] [--force]
+    python3 notebook_patches.py Chapter_11.ipynb style_ch11_phillies add_phillies_header
+"""
+import hashlib
+import importlib
+import os
+import re
+import sys
+import json
+import time
+
+import nbformat
+
+from atomic_write import atomic_write
+from cell_diff import diff_cells, print_diff, snapshot
+from parallel_jobs import run_jobs
+# widget_template is imported here for the patch scripts to use
+from template_registry import check_templates, templates_digest, widget_template
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+MANIFEST_PATH = os.path.join(SCRIPT_DIR, "patch_manifest.json")
+
+def topological_order(names, prerequisites):
+    """
+    Orders names so every patch comes after its prerequisites. Among patches that are free
+    to run, the one listed first goes first, so the listed order is kept wherever the
+    dependencies allow it. Raises ValueError on a cycle.
+    """
+    remaining = list(names)
+    done = set()
+    ordered = []
+    while remaining:
+        for name in remaining:
+            if all(dep in done for dep in prerequisites.get(name, [])):
+                break
+        else:
+            raise ValueError(f"Patch dependencies form a cycle: {', '.join(remaining)}")
+        remaining.remove(name)
+        done.add(name)
+        ordered.append(name)
+    return ordered
+
+def load_manifest(path=MANIFEST_PATH):
+    """
+    Reads the build manifest. Returns {chapter: (notebook, patches in run order)} and
+    {patch: [prerequisites]}. A prerequisite must be a patch of the same chapter.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    pipelines = {}
+    prerequisites = {}
+    for chapter, entry in manifest["chapters"].items():
+        names = [p["patch"] for p in entry["patches"]]
+        for p in entry["patches"]:
+            for dep in p.get("after", []):
+                if dep not in names:
+                    raise ValueError(f"{p['patch']} runs after {dep}, which isn't a patch of chapter {chapter}")
+            prerequisites[p["patch"]] = p.get("after", [])
+        pipelines[int(chapter)] = (entry["notebook"], topological_order(names, prerequisites))
+    return pipelines, prerequisites
+
+# The notebook each chapter is built into and the patches that add its widgets, in the
+# order they run. Patch names are the names of the scripts that define them.
+CHAPTER_PIPELINES, PREREQUISITES = load_manifest()
+
+# Patch name -> function that edits a notebook in place
+PATCHES = {}
+
+def notebook_patch(func):
+    """
+    Registers func(nb) as a patch named after the script that defines it, so the same
+    name works whether the script is imported or run directly.
+    """
+    name = os.path.splitext(os.path.basename(func.__code__.co_filename))[0]
+    PATCHES[name] = func
+    return func
+
+# Heading lines: "# Title" or a line that starts with a bold run such as "**<u>Simulation:</u>**"
+HEADING_RE = re.compile(r'^(?:#+\s*(.+)|\*\*(.+?)\*\*)', re.MULTILINE)
+
+def normalize_heading(text):
+    """
+    Reduces heading text to a lookup key: markup, case and trailing colons are ignored,
+    so "**<u>Simulation:</u>**" and "simulation" match.
+    """
+    text = re.sub(r'<[^>]+>', '', text)
+    text = re.sub(r'[*_`]', '', text)
+    return " ".join(text.split()).rstrip(':').strip().casefold()
+
+def cell_headings(cell):
+    if cell.cell_type != 'markdown':
+        return set()
+    return {normalize_heading(m.group(1) or m.group(2)) for m in HEADING_RE.finditer(cell.source)}
+
+class CellIndex:
+    """
+    Finds notebook cells by anchor ID (cell.metadata["anchor"]) or by heading text.
+
+    Cells are tracked by identity rather than position, so lookups stay correct after
+    cells are inserted, deleted or moved. Positions are recomputed only when the list has
+    changed, and a cell's source is scanned for headings again only when it has changed.
+    """
+    def __init__(self, nb):
+        self.nb = nb
+        self.positions = {}
+        self.anchors = {}
+        self.headings = {}
+        # id(cell) -> (cell, source it was indexed with)
+        self.seen = {}
+        self.refresh()
+
+    def refresh(self, changed=False):
+        """
+        Picks up cells added since the last refresh. With changed=True, cells whose source
+        was rewritten since they were indexed are re-read too.
+        """
+        self.positions = {id(cell): i for i, cell in enumerate(self.nb.cells)}
+        for cell in self.nb.cells:
+            old = self.seen.get(id(cell))
+            if old is None or (changed and old[1] is not cell.source and old[1] != cell.source):
+                self.reindex(cell)
+
+    def reindex(self, cell):
+        """Re-reads one cell's anchor and headings, e.g. after replacing its source."""
+        # Holding the cell keeps its id from being reused by a new cell
+        self.seen[id(cell)] = (cell, cell.source)
+        anchor = cell.metadata.get("anchor")
+        if anchor:
+            self.anchors[anchor] = cell
+        for heading in cell_headings(cell):
+            cells = self.headings.setdefault(heading, [])
+            if not any(c is cell for c in cells):
+                cells.append(cell)
+
+    def position(self, cell):
+        """Current index of cell in nb.cells, or -1 if it is no longer in the notebook."""
+        pos = self.positions.get(id(cell), -1)
+        if pos == -1 or pos >= len(self.nb.cells) or self.nb.cells[pos] is not cell:
+            self.refresh()
+            pos = self.positions.get(id(cell), -1)
+        return pos
+
+    def set_anchor(self, cell, anchor):
+        """Tags cell with a stable anchor ID that later patches (and later runs) can find."""
+        cell.metadata["anchor"] = anchor
+        self.anchors[anchor] = cell
+
+    def anchor(self, anchor):
+        """Index of the cell tagged with anchor, or -1."""
+        cell = self.anchors.get(anchor)
+        if cell is None or cell.metadata.get("anchor") != anchor:
+            self.refresh()
+            cell = self.anchors.get(anchor)
+        return -1 if cell is None else self.position(cell)
+
+    def find(self, match):
+        """Index of the first cell for which match(cell) is true, or -1. Scans every cell."""
+        for i, cell in enumerate(self.nb.cells):
+            if match(cell):
+                return i
+        return -1
+
+    def heading(self, text, contains=None):
+        """
+        Index of the first markdown cell with this heading, or -1. If no heading matches
+        and contains is given, falls back to the first cell whose source contains it.
+        """
+        key = normalize_heading(text)
+        for attempt in range(2):
+            found = []
+            for cell in self.headings.get(key, []):
+                pos = self.position(cell)
+                if pos != -1 and key in cell_headings(cell):
+                    found.append(pos)
+            if found:
+                return min(found)
+            # Not found: the heading may be in a cell whose source was rewritten
+            # since it was indexed, so re-read the cells that changed
+            if attempt == 0:
+                self.refresh(changed=True)
+        if contains is not None:
+            return self.find(lambda cell: contains in cell.source)
+        return -1
+
+    def widget(self, anchor, marker):
+        """
+        Index of the code cell tagged with anchor, or -1. In a notebook saved before the
+        cell was tagged, the first code cell containing marker (such as
+        "class WorldSeriesSimulator") is found instead and tagged for next time.
+        """
+        pos = self.anchor(anchor)
+        if pos == -1:
+            pos = self.find(lambda cell: cell.cell_type == 'code' and marker in cell.source)
+            if pos != -1:
+                self.set_anchor(self.nb.cells[pos], anchor)
+        return pos
+
+# The "# @title ..." line a Colab form cell starts with
+COLAB_TITLE_RE = re.compile(r'#\s*@title\b[^\n]*(?:\n|$)')
+
+def colab_title(source):
+    """The Colab form title line source starts with, or ''."""
+    m = COLAB_TITLE_RE.match(source)
+    return m.group(0) if m else ''
+
+def set_source(cell, source):
+    """
+    Replaces a cell's source. A "# @title" line that was added to a widget cell by hand
+    in Colab is kept, unless the new source has a title of its own.
+    """
+    title = colab_title(cell.source)
+    if title and not colab_title(source):
+        source = title + source
+    cell.source = source
+
+# Indexes for the notebooks apply_patches() is working on, keyed by id(nb)
+_INDEXES = {}
+
+def cell_index(nb):
+    """The CellIndex for nb, shared by all patches applied in the same run."""
+    entry = _INDEXES.get(id(nb))
+    if entry is None or entry[0] is not nb:
+        entry = _INDEXES[id(nb)] = (nb, CellIndex(nb))
+    return entry[1]
+
+def load_patch(name):
+    """Returns the patch called name, importing its script if needed."""
+    if name not in PATCHES:
+        if SCRIPT_DIR not in sys.path:
+            sys.path.insert(0, SCRIPT_DIR)
+        importlib.import_module(name)
+    if name not in PATCHES:
+        raise KeyError(f"{name}.py does not define a @notebook_patch")
+    return PATCHES[name]
+
+def patch_fingerprint(name):
+    """
+    Hash of the script defining a patch, its widget templates and its prerequisites'
+    fingerprints, so editing the script or anything it builds on changes it.
+    """
+    digest = hashlib.sha256()
+    with open(load_patch(name).__code__.co_filename, 'rb') as f:
+        digest.update(f.read())
+    digest.update(templates_digest(name).encode('ascii'))
+    for dep in PREREQUISITES.get(name, []):
+        digest.update(patch_fingerprint(dep).encode('ascii'))
+    return digest.hexdigest()[:16]
+
+def content_hash(cell):
+    """
+    Hash of a cell's type and source. A Colab "# @title" line is left out, so giving a
+    widget cell a title by hand doesn't count as editing it.
+    """
+    source = cell.source[len(colab_title(cell.source)):]
+    return hashlib.sha256(f"{cell.cell_type}\n{source}".encode('utf-8')).hexdigest()[:16]
+
+# Top-level classes and functions of a widget's code
+WIDGET_NAME_RE = re.compile(r'^(?:class|def)\s+(\w+)', re.MULTILINE)
+
+def _body(source):
+    return source[len(colab_title(source)):].strip()
+
+def _same_content(a, b):
+    return a.cell_type == b.cell_type and _body(a.source) == _body(b.source)
+
+def _same_widget(a, b):
+    """True for code cells defining a class or function of the same name, or markdown cells with the same heading line."""
+    if a.cell_type != b.cell_type:
+        return False
+    if a.cell_type == 'code':
+        return bool(set(WIDGET_NAME_RE.findall(a.source)) & set(WIDGET_NAME_RE.findall(b.source)))
+    heading = a.source.strip().split('\n', 1)[0]
+    return heading.startswith('#') and heading == b.source.strip().split('\n', 1)[0]
+
+def adopt_cells(nb, name, before):
+    """
+    Lets cells already in the notebook stand in for the cells patch `name` just inserted,
+    so a patch never adds a second copy of a widget. Notebooks saved before patches were
+    stamped already contain their widgets, and a patch that runs again finds the cells
+    it inserted last time.
+
+    A new cell is matched to an unstamped cell, or one this patch inserted, that the patch
+    left alone: first one with the same content (ignoring a Colab "# @title" line), then
+    the same widget or heading, then the widget cell right after the cell the previous
+    new cell was matched to. The new cell is dropped, and the existing one keeps its place,
+    metadata and title line and takes the new source, unless it was edited by hand: a
+    stamped cell whose hash no longer matches, or an unstamped cell matched only by its
+    position. New cells that took the place of a cell the patch removed are left alone.
+
+    Returns {id(cell): hash of the source the patch wrote} for the cells kept.
+    """
+    order = list(before)
+    current = {id(cell) for cell in nb.cells}
+    following = dict(zip([None] + order, order))
+
+    def replaces_a_cell(pos):
+        previous = next((id(c) for c in reversed(nb.cells[:pos]) if id(c) in before), None)
+        nxt = following.get(previous)
+        return nxt is not None and nxt not in current
+
+    adopted = {}
+    def available(cell):
+        old = before.get(id(cell))
+        if old is None or old[1] != cell.source or id(cell) in adopted:
+            return False
+        stamp = cell.metadata.get("patch")
+        return stamp is None or (stamp.get("id") == name and stamp.get("action") == "insert")
+
+    matched = {}
+    updated = kept = 0
+    for pos, new in enumerate(nb.cells):
+        if id(new) in before or replaces_a_cell(pos):
+            continue
+        old = next((c for c in nb.cells if available(c) and _same_content(c, new)), None)
+        if old is None:
+            old = next((c for c in nb.cells if available(c) and _same_widget(c, new)), None)
+        by_position = False
+        if old is None and pos > 0 and id(nb.cells[pos - 1]) in matched:
+            prev = matched[id(nb.cells[pos - 1])]
+            after = next(i for i, c in enumerate(nb.cells) if c is prev) + 1
+            candidate = nb.cells[after] if after < len(nb.cells) else None
+            if (candidate is not None and available(candidate) and candidate.cell_type == new.cell_type
+                    and (new.cell_type == 'markdown' or "ipywidgets" in candidate.source)):
+                old, by_position = candidate, True
+        if old is None:
+            continue
+
+        matched[id(new)] = old
+        adopted[id(old)] = content_hash(new)
+        stamp = old.metadata.get("patch")
+        edited = by_position if stamp is None else stamp.get("hash") != content_hash(old)
+        if _same_content(old, new):
+            pass
+        elif edited:
+            kept += 1
+        else:
+            set_source(old, new.source)
+            updated += 1
+        old.metadata.update(new.metadata)
+        entry = _INDEXES.get(id(nb))
+        if entry is not None and entry[0] is nb:
+            entry[1].reindex(old)
+
+    if matched:
+        nb.cells[:] = [cell for cell in nb.cells if id(cell) not in matched]
+        print(f"Found {len(matched)} of the new cells already in the notebook "
+              f"({updated} updated, {kept} edited by hand and kept as they are).")
+    return adopted
+
+def stamp_cells(nb, name, before):
+    """
+    Stamps the cells patch `name` just inserted or rewrote. before maps id(cell) to
+    (cell, source) from just before the patch ran.
+
+    Inserted cells that are already in the notebook are matched up with the existing
+    cells first (see adopt_cells). If the patch inserted cells, any cells it inserted on
+    an earlier run and left alone this time are removed: re-running an edited patch
+    replaces its old cells instead of adding a second copy.
+    """
+    adopted = adopt_cells(nb, name, before)
+    touched = set()
+    inserted_any = False
+    for cell in nb.cells:
+        old = before.get(id(cell))
+        if id(cell) in adopted:
+            cell.metadata["patch"] = {"id": name, "hash": adopted[id(cell)], "action": "insert"}
+            touched.add(id(cell))
+            inserted_any = True
+            continue
+        if old is None:
+            action = "insert"
+            inserted_any = True
+        elif old[1] != cell.source:
+            # A patch rewriting its own inserted cell still owns it; anyone else's is an update
+            stamp = cell.metadata.get("patch", {})
+            action = "insert" if stamp.get("id") == name and stamp.get("action") == "insert" else "update"
+        else:
+            continue
+        cell.metadata["patch"] = {"id": name, "hash": content_hash(cell), "action": action}
+        touched.add(id(cell))
+
+    if inserted_any:
+        stale = [i for i, cell in enumerate(nb.cells)
+                 if id(cell) not in touched
+                 and cell.metadata.get("patch", {}).get("id") == name
+                 and cell.metadata["patch"].get("action") == "insert"]
+        for i in reversed(stale):
+            del nb.cells[i]
+        if stale:
+            print(f"Replaced {len(stale)} cells from an earlier run of {name}.")
+
+def drop_unsupported_ids(nb):
+    """
+    Cell ids only exist from nbformat 4.5 on, but nbformat.v4.new_*_cell() always gives
+    new cells one. The chapter notebooks are 4.4, so the ids patches bring in are removed
+    before saving, instead of failing validation on every build.
+    """
+    if (nb.nbformat, nb.nbformat_minor) < (4, 5):
+        for cell in nb.cells:
+            cell.pop("id", None)
+
+def validate_notebook(nb):
+    """
+    Checks nb against the nbformat schema and prints how long that took. Like nbformat.write,
+    a notebook that doesn't match is reported but still saved.
+    """
+    start = time.perf_counter()
+    try:
+        nbformat.validate(nb)
+        error = None
+    except nbformat.ValidationError as e:
+        error = e
+    elapsed = (time.perf_counter() - start) * 1000
+    if error is None:
+        print(f"Validated notebook in {elapsed:.1f} ms.")
+    else:
+        print(f"Warning: notebook does not match the nbformat schema ({elapsed:.1f} ms): {error.message}")
+    return error is None
+
+def read_notebook(path):
+    """Reads a notebook as nbformat v4 without validating it against the schema."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return nbformat.convert(nbformat.reader.reads(f.read()), 4)
+
+def writes_unvalidated(nb):
+    """nbformat.writes() without the schema validation it runs first."""
+    return nbformat.versions[nb.nbformat].writes_json(nb)
+
+def write_notebook(nb, path):
+    """
+    Validates nb once, then saves it crash-safely with atomic_write(). Returns False, without
+    touching the file, if the notebook is byte-for-byte unchanged.
+    """
+    drop_unsupported_ids(nb)
+    validate_notebook(nb)
+    return atomic_write(path, lambda f: f.write(writes_unvalidated(nb) + '\n'))
+
+def apply_patches(notebook_path, names, output_path=None, force=False):
+    """
+    Applies the named patches to a notebook in order with one read and one write.
+    Patches already applied in their current version are skipped unless force is set or
+    one of their prerequisites ran again. Returns False if the notebook doesn't exist.
+    """
+    if not os.path.exists(notebook_path):
+        print(f"Error: {notebook_path} not found.")
+        return False
+
+    # Import everything and compile the widget templates first, so a missing script or a
+    # syntax error fails before any work is done
+    patches = [(name, load_patch(name)) for name in names]
+    check_templates(names)
+
+    print(f"Reading {notebook_path}...")
+    nb = read_notebook(notebook_path)
+    before = snapshot(nb)
+
+    applied = nb.metadata.setdefault("patches", {})
+    ran = set()
+    try:
+        for name, patch in patches:
+            fingerprint = patch_fingerprint(name)
+            changed_deps = ran.intersection(PREREQUISITES.get(name, []))
+            if not force and not changed_deps and applied.get(name) == fingerprint:
+                print(f"Skipping {name} (already applied)")
+                continue
+            print(f"Applying {name}...")
+            sources = {id(cell): (cell, cell.source) for cell in nb.cells}
+            patch(nb)
+            stamp_cells(nb, name, sources)
+            applied[name] = fingerprint
+            ran.add(name)
+    finally:
+        _INDEXES.pop(id(nb), None)
+
+    output_path = output_path or notebook_path
+    same_file = os.path.abspath(output_path) == os.path.abspath(notebook_path)
+    if not ran and same_file:
+        print("Notebook is up to date.")
+        return True
+
+    changes = diff_cells(before, nb)
+    if not changes and same_file:
+        print("No changes, file left as is.")
+        return True
+    print("Changes:")
+    print_diff(changes)
+    print(f"Saving to {output_path}...")
+    if write_notebook(nb, output_path):
+        print("Done!")
+    else:
+        print("No changes, file left as is.")
+    return True
+
+def apply_chapter_patches(chapter, notebook_path=None, force=False):
+    """Runs a chapter's whole pipeline from CHAPTER_PIPELINES."""
+    notebook, names = CHAPTER_PIPELINES[chapter]
+    return apply_patches(notebook_path or os.path.join(SCRIPT_DIR, notebook), names, force=force)
+
+def _build_chapter(chapter, force):
+    # Import by name so a worker started with "spawn" uses the same registry as the scripts
+    import notebook_patches
+    return None if notebook_patches.apply_chapter_patches(chapter, force=force) else "notebook not found"
+
+def build_chapters(chapters=None, max_workers=None, force=False):
+    """
+    Runs the pipelines of several chapters (all of them by default) in parallel on a
+    process pool, one worker per notebook. Prints each chapter's log as it finishes, then
+    a table of per-chapter wall times. Chapters whose notebook isn't in the repository
+    (e.g. Chapter 9) are skipped rather than failed. Returns the number of chapters that failed.
+    """
+    chapters = sorted(chapters or CHAPTER_PIPELINES)
+    skipped = [c for c in chapters if not os.path.exists(os.path.join(SCRIPT_DIR, CHAPTER_PIPELINES[c][0]))]
+    for chapter in skipped:
+        print(f"[skipped] Chapter {chapter}: {CHAPTER_PIPELINES[chapter][0]} not found")
+    chapters = [c for c in chapters if c not in skipped]
+    if not chapters:
+        print("Nothing to build.")
+        return 0
+    max_workers = max_workers or len(chapters)
+    print(f"Building {len(chapters)} chapters with {max_workers} workers...")
+
+    def label(chapter):
+        return f"Chapter {chapter}: {CHAPTER_PIPELINES[chapter][0]}"
+    jobs = [(label(chapter), _build_chapter, (chapter, force)) for chapter in chapters]
+    return run_jobs(jobs, max_workers, "Build Summary", "Built",
+                    skipped=[(label(chapter), "notebook not found") for chapter in skipped])
+
+if __name__ == "__main__":
+    # Scripts import this file as notebook_patches; make that the module running now so
+    # their patches land in this PATCHES registry rather than a second copy's
+    sys.modules.setdefault("notebook_patches", sys.modules[__name__])
+
+    args = sys.argv[1:]
+    force = "--force" in args
+    if force:
+        args.remove("--force")
+    if args and args[0] == "--build":
+        jobs = None
+        if "--jobs" in args:
+            i = args.index("--jobs")
+            jobs = int(args[i + 1])
+            del args[i:i + 2]
+        ok = build_chapters([int(a) for a in args[1:]], jobs, force) == 0
+    elif len(args) == 2 and args[0] == "--chapter":
+        ok = apply_chapter_patches(int(args[1]), force=force)
+    elif len(args) > 1:
+        ok = apply_patches(args[0], args[1:], force=force)
+    else:
+        print("Usage: python3 notebook_patches.py --chapter <N> [--force]")
+        print("       python3 notebook_patches.py --build [<N> ...] [--jobs <N>] [--force]")
+        print("       python3 notebook_patches.py <notebook.ipynb> <patch> [<patch> ...] [--force]")
+        ok = False
+    sys.exit(0 if ok else 1)
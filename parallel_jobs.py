@@ -0,0 +1,59 @@
+"""
+Process-pool job runner shared by convert_doc.py --batch and notebook_patches.py --build.
+"""
+import contextlib
+import io
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+def _run_job(func, args):
+    # Collect the job's output so parallel jobs don't interleave their logs
+    log = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        try:
+            error = func(*args)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    return time.perf_counter() - start, error, log.getvalue()
+
+def run_jobs(jobs, max_workers, title, done, skipped=(), before_summary=None):
+    """
+    Runs each (label, func, args) job in a worker process, at most max_workers at a time.
+    func must be a module-level function; func(*args) returns None on success or an error
+    message, and an exception counts as a failure too.
+
+    Each job's log is printed in one piece as soon as the job finishes. Then a table of
+    per-job wall times headed title is printed, with the (label, reason) pairs in skipped
+    at the end, and a "{done}: ok/total" line. before_summary() runs after the last job,
+    before the table. Returns the number of jobs that failed.
+    """
+    results = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(_run_job, func, args): i for i, (_, func, args) in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            elapsed, error, log = future.result()
+            status = "FAILED" if error else "ok"
+            print(f"\n[{status}] {jobs[i][0]} ({elapsed:.2f}s){': ' + error if error else ''}")
+            print(log, end="")
+            results[i] = (jobs[i][0], elapsed, error)
+    wall_time = time.perf_counter() - start
+
+    if before_summary is not None:
+        before_summary()
+
+    failures = sum(1 for _, _, error in results.values() if error)
+    serial_time = sum(elapsed for _, elapsed, _ in results.values())
+    print(f"\n{title}")
+    print("-" * 50)
+    for i in sorted(results):
+        label, elapsed, error = results[i]
+        print(f"{label:<40} {elapsed:>8.2f}s{'  FAILED' if error else ''}")
+    for label, reason in skipped:
+        print(f"{label:<40}  skipped ({reason})")
+    print("-" * 50)
+    print(f"{done}: {len(results) - failures}/{len(results)}{f', {len(skipped)} skipped' if skipped else ''}")
+    print(f"Wall time: {wall_time:.2f}s (serial would be ~{serial_time:.2f}s)")
+    return failures
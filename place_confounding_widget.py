@@ -1,10 +1,7 @@
-import nbformat
-
-def place_widget():
-    nb_path = 'Chapter_10_updated.ipynb'
-    with open(nb_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
+from notebook_patches import notebook_patch, apply_patches
 
+@notebook_patch
+def place_widget(nb):
     # Content signatures
     def_signature = "**Confounding:**"
     examples_signature = "**What could be the confounding factor?**"
@@ -89,10 +86,7 @@ def place_widget():
             new_cells.append(widget_cell)
 
     nb.cells = new_cells
-
-    with open(nb_path, 'w', encoding='utf-8') as f:
-        nbformat.write(nb, f)
     print("Notebook updated successfully.")
 
 if __name__ == "__main__":
-    place_widget()
+    apply_patches('Chapter_10_updated.ipynb', ['place_confounding_widget'])
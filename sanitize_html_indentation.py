@@ -1,16 +1,7 @@
-import nbformat
-import os
-
-def sanitize_indentation():
-    nb_path = 'Chapter_11.ipynb'
-    if not os.path.exists(nb_path):
-        print(f"Error: {nb_path} not found.")
-        return
-
-    print(f"Reading {nb_path}...")
-    with open(nb_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
+from notebook_patches import notebook_patch, apply_patches
 
+@notebook_patch
+def sanitize_indentation(nb):
     # Find the cell with the Phillies HTML content
     target_idx = -1
     for i, cell in enumerate(nb.cells):
@@ -34,10 +25,5 @@ def sanitize_indentation():
     # Reassemble
     nb.cells[target_idx].source = "\n".join(cleaned_lines)
 
-    print(f"Saving to {nb_path}...")
-    with open(nb_path, 'w', encoding='utf-8') as f:
-        nbformat.write(nb, f)
-    print("Done!")
-
 if __name__ == "__main__":
-    sanitize_indentation()
+    apply_patches('Chapter_11.ipynb', ['sanitize_html_indentation'])
@@ -1,7 +1,7 @@
 
-import nbformat
 from nbformat.v4 import new_markdown_cell
 import re
+from notebook_patches import notebook_patch, apply_patches
 
 def create_styled_cereal_content():
     # Based on standard stats curriculum (e.g. TPS/BVD), the Cereal box problem usually is:
@@ -77,11 +77,8 @@ def create_styled_cereal_content():
     
     return title_md + "\n\n" + key_html + "\n" + viz_html
 
-def stylize_chapter_11(notebook_path, output_path):
-    print(f"Reading {notebook_path}...")
-    with open(notebook_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
-
+@notebook_patch
+def stylize_chapter_11(nb):
     # Find Cell 15 (Simulation Table)
     target_idx = -1
     for i, cell in enumerate(nb.cells):
@@ -140,10 +137,5 @@ def stylize_chapter_11(notebook_path, output_path):
         
         nb.cells[model_idx] = new_markdown_cell(new_source)
 
-    print(f"Saving to {output_path}...")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        nbformat.write(nb, f)
-    print("Done!")
-
 if __name__ == "__main__":
-    stylize_chapter_11("Chapter_11.ipynb", "Chapter_11.ipynb")
+    apply_patches("Chapter_11.ipynb", ["style_ch11_cereal"])
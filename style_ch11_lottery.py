@@ -1,7 +1,6 @@
-import nbformat
 from nbformat.v4 import new_code_cell, new_markdown_cell
-import os
 import textwrap
+from notebook_patches import notebook_patch, apply_patches, cell_index, set_source, widget_template
 
 def create_styled_lottery_content():
     # Explanation HTML
@@ -46,149 +45,28 @@ def create_styled_lottery_content():
     return textwrap.dedent(html)
 
 def create_widget_code():
-    return """import ipywidgets as widgets
-from IPython.display import display, clear_output
-import numpy as np
-import matplotlib.pyplot as plt
+    return widget_template("style_ch11_lottery/dorm_lottery_simulator")
 
-class DormLotterySimulator:
-    def __init__(self):
-        # Configuration
-        self.total_students = 57
-        self.num_athletes = 20
-        self.spots = 3
-        
-        # Simulation State
-        self.results = [] # Store count of athletes in each trial (0, 1, 2, or 3)
-        self.current_winners = []
-        
-        # UI Elements
-        self.out_display = widgets.Output()
-        self.out_plot = widgets.Output()
-        
-        self.btn_draw = widgets.Button(description="Run 1 Lottery", button_style='info', icon='ticket')
-        self.btn_sim_1000 = widgets.Button(description="Simulate 1000 Lotteries", button_style='success', icon='fast-forward')
-        self.btn_reset = widgets.Button(description="Reset Stats", button_style='warning', icon='refresh')
-        
-        self.btn_draw.on_click(self.on_draw)
-        self.btn_sim_1000.on_click(self.on_sim_1000)
-        self.btn_reset.on_click(self.on_reset)
-        
-        self.dashboard = widgets.VBox([
-            widgets.HTML("<h3>🎫 Interactive Lottery Simulator</h3>"),
-            widgets.HTML(f"<p>Draw <strong>{self.spots}</strong> winners from <strong>{self.total_students}</strong> students ({self.num_athletes} Athletes).</p>"),
-            widgets.HBox([self.btn_draw, self.btn_reset]),
-            self.out_display,
-            widgets.HTML("<hr>"),
-            self.btn_sim_1000,
-            self.out_plot
-        ])
-        
-        self.update_display()
-
-    def run_lottery(self):
-        # Create pool: 1=Athlete, 0=Non-Athlete
-        pool = [1]*self.num_athletes + [0]*(self.total_students - self.num_athletes)
-        # Draw without replacement
-        winners = np.random.choice(pool, size=self.spots, replace=False)
-        return winners
-
-    def on_draw(self, b):
-        self.current_winners = self.run_lottery()
-        athlete_count = sum(self.current_winners)
-        self.results.append(athlete_count)
-        self.update_display()
-
-    def on_sim_1000(self, b):
-        new_results = [sum(self.run_lottery()) for _ in range(1000)]
-        self.results.extend(new_results)
-        self.current_winners = []
-        self.update_display()
-        self.update_plot()
-
-    def on_reset(self, b):
-        self.results = []
-        self.current_winners = []
-        self.out_plot.clear_output()
-        self.update_display()
-
-    def update_display(self):
-        with self.out_display:
-            clear_output(wait=True)
-            
-            # Show last draw if exists
-            if len(self.current_winners) > 0:
-                html_draw = '<div style="margin: 10px 0; font-size: 1.1em;">Last Draw: '
-                for is_athlete in self.current_winners:
-                    if is_athlete:
-                        html_draw += '<span style="background:#ffeeba; border:1px solid #ffdf7e; padding:3px 8px; border-radius:10px; margin-right:5px;">🏃 Athlete</span>'
-                    else:
-                        html_draw += '<span style="background:#e2e3e5; border:1px solid #dae0e5; padding:3px 8px; border-radius:10px; margin-right:5px;">🎓 Student</span>'
-                html_draw += '</div>'
-                display(widgets.HTML(html_draw))
-                
-                if sum(self.current_winners) == 3:
-                    display(widgets.HTML('<div style="color:red; font-weight:bold;">⚠️ ALL ATHLETES! (Suspicious?)</div>'))
+@notebook_patch
+def update_notebook(nb):
+    index = cell_index(nb)
 
-    def update_plot(self):
-        with self.out_plot:
-            clear_output(wait=True)
-            if not self.results: return
-            
-            counts = [self.results.count(i) for i in range(4)]
-            total = len(self.results)
-            
-            plt.figure(figsize=(8, 4))
-            bars = plt.bar(['0 Athletes', '1 Athlete', '2 Athletes', '3 Athletes'], counts, color=['#e2e3e5', '#badce3', '#ffeeba', '#f5c6cb'])
-            
-            # Add percentages
-            for bar, count in zip(bars, counts):
-                if count > 0:
-                    plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), f'{count/total:.1%}', 
-                             ha='center', va='bottom', fontweight='bold')
-            
-            plt.title(f"Outcomes of {total} Simulated Lotteries")
-            plt.ylabel("Frequency")
-            plt.grid(axis='y', alpha=0.3)
-            plt.show()
-
-# Run
-lottery_sim = DormLotterySimulator()
-display(lottery_sim.dashboard)
-"""
-
-def update_notebook():
-    nb_path = 'Chapter_11.ipynb'
-    if not os.path.exists(nb_path):
-        print(f"Error: {nb_path} not found.")
-        return
-
-    print(f"Reading {nb_path}...")
-    with open(nb_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
-
-    # Search for "Example 2" to identify the cell
-    target_idx = -1
-    for i, cell in enumerate(nb.cells):
-        if "**Example 2:**" in cell.source:
-            target_idx = i
-            break
-            
+    # Search for "Example 2" to identify the cell; once styled, it is found by its title
+    target_idx = index.heading("Example 2:", contains="**Example 2:**")
     if target_idx == -1:
-        print("Could not find Example 2 cell.")
-        return
+        target_idx = index.find(lambda cell: cell.cell_type == 'markdown' and "Dorm Room Lottery Model" in cell.source)
 
-    print(f"Found Example 2 at cell {target_idx}. Updating content...")
-    
-    # 1. Update the static markdown cell
-    nb.cells[target_idx].source = create_styled_lottery_content()
-    
-    # 2. Inject the widget immediately after
-    # Check if widget is already there
-    if target_idx + 1 < len(nb.cells) and "class DormLotterySimulator" in nb.cells[target_idx+1].source:
+    if target_idx != -1:
+        print(f"Found Example 2 at cell {target_idx}. Updating content...")
+        # 1. Update the static markdown cell
+        nb.cells[target_idx].source = create_styled_lottery_content()
+
+    # 2. Update the widget where it is, or inject it immediately after the example
+    widget_idx = index.widget("dorm-lottery-simulator", "class DormLotterySimulator")
+    if widget_idx != -1:
         print("Widget code already exists. Updating it...")
-        nb.cells[target_idx+1].source = create_widget_code()
-    else:
+        set_source(nb.cells[widget_idx], create_widget_code())
+    elif target_idx != -1:
         print("Injecting new widget code...")
         
         # Create Header Cell
@@ -196,15 +74,13 @@ def update_notebook():
         
         # Create Code Cell
         code_cell = new_code_cell(create_widget_code())
+        index.set_anchor(code_cell, "dorm-lottery-simulator")
         
         # Insert both
         nb.cells.insert(target_idx + 1, header_cell)
         nb.cells.insert(target_idx + 2, code_cell)
-
-    print(f"Saving to {nb_path}...")
-    with open(nb_path, 'w', encoding='utf-8') as f:
-        nbformat.write(nb, f)
-    print("Done!")
+    else:
+        print("Could not find Example 2 cell.")
 
 if __name__ == "__main__":
-    update_notebook()
+    apply_patches('Chapter_11.ipynb', ['style_ch11_lottery'])
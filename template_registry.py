@@ -0,0 +1,114 @@
+"""
+Registry of widget code templates.
+
+The code a patch puts into a widget cell lives in widget_templates/<patch>/<name>.py as an
+ordinary Python file, rather than as a triple-quoted string inside the patch script, so
+it can be read, edited and linted like any other code. widget_template("<patch>/<name>")
+returns a template's source for a patch to insert.
+
+Every template is compiled before it is used, so a syntax error stops the build before
+any notebook is written. The compiled bytecode is cached in .template_cache/ under a hash
+of the template's source and the Python bytecode version, and templates that haven't
+changed since are not checked again by the same Python.
+
+Usage:
+    python3 template_registry.py          # checks every template
+"""
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(SCRIPT_DIR, "widget_templates")
+TEMPLATE_CACHE_DIR = os.path.join(SCRIPT_DIR, ".template_cache")
+
+# Template name -> (source hash, code object), for templates checked in this process
+_COMPILED = {}
+
+def template_path(name):
+    return os.path.join(TEMPLATE_DIR, *name.split("/")) + ".py"
+
+def read_template(name):
+    # newline='' keeps the source exactly as written
+    with open(template_path(name), 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+def compile_template(name, source=None):
+    """
+    Returns the compiled code of a template, raising SyntaxError if it doesn't compile.
+    The result is cached by content hash, in memory and in TEMPLATE_CACHE_DIR. The file
+    cache is also keyed by the interpreter's bytecode magic number: code compiled by one
+    Python version says nothing about whether the template compiles on another.
+    """
+    if source is None:
+        source = read_template(name)
+    digest = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+    cached = _COMPILED.get(name)
+    if cached and cached[0] == digest:
+        return cached[1]
+
+    cache_key = hashlib.sha256(importlib.util.MAGIC_NUMBER + source.encode('utf-8')).hexdigest()[:16]
+    cache_path = os.path.join(TEMPLATE_CACHE_DIR, f"{cache_key}.bin")
+    code = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                code = marshal.load(f)
+        except (EOFError, ValueError, TypeError):
+            # Cut short; compile again
+            code = None
+
+    if code is None:
+        code = compile(source, template_path(name), 'exec')
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            marshal.dump(code, f)
+        os.replace(tmp_path, cache_path)
+
+    _COMPILED[name] = (digest, code)
+    return code
+
+def widget_template(name):
+    """The source of a widget template, checked to compile."""
+    source = read_template(name)
+    compile_template(name, source)
+    return source
+
+def templates_for(patch):
+    """Names of the templates in widget_templates/<patch>/, sorted."""
+    folder = os.path.join(TEMPLATE_DIR, patch)
+    if not os.path.isdir(folder):
+        return []
+    return sorted(f"{patch}/{os.path.splitext(f)[0]}" for f in os.listdir(folder) if f.endswith(".py"))
+
+def check_templates(patches):
+    """Compiles every template belonging to the given patches. Raises SyntaxError on the first bad one."""
+    for patch in patches:
+        for name in templates_for(patch):
+            compile_template(name)
+
+def templates_digest(patch):
+    """Hash of a patch's templates, so editing one counts as a change to the patch."""
+    digest = hashlib.sha256()
+    for name in templates_for(patch):
+        digest.update(name.encode('utf-8'))
+        with open(template_path(name), 'rb') as f:
+            digest.update(hashlib.sha256(f.read()).digest())
+    return digest.hexdigest()[:16]
+
+if __name__ == "__main__":
+    patches = sorted(d for d in os.listdir(TEMPLATE_DIR) if os.path.isdir(os.path.join(TEMPLATE_DIR, d)))
+    failed = 0
+    for patch in patches:
+        for name in templates_for(patch):
+            try:
+                compile_template(name)
+                print(f"ok      {name}")
+            except SyntaxError as e:
+                failed += 1
+                print(f"FAILED  {name}: {e}")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,21 @@
+# @title 🥗 The Lunch Special: Addition Rule (OR)
+import ipywidgets as widgets
+from IPython.display import display, HTML
+
+def update_or_rule(salads, sandwiches):
+    total = salads + sandwiches
+    display(HTML(f"""
+    <div style="border: 2px solid #2E7D32; padding: 15px; border-radius: 10px; background-color: #f1f8e9;">
+        <h4 style="color: #2E7D32; margin-top:0;">Rule of Addition (OR)</h4>
+        <p>If you choose <b>1</b> item from <b>Set A</b> ({salads} options) <b>OR</b> <b>1</b> item from <b>Set B</b> ({sandwiches} options):</p>
+        <p style="font-size: 1.2em; font-weight: bold;">{salads} + {sandwiches} = <span style="color: #c62828;">{total} Total Options</span></p>
+    </div>
+    """))
+
+salads_slider = widgets.IntSlider(value=4, min=1, max=10, description='Salads:')
+sands_slider = widgets.IntSlider(value=5, min=1, max=10, description='Sandwiches:')
+
+ui = widgets.HBox([salads_slider, sands_slider])
+out = widgets.interactive_output(update_or_rule, {'salads': salads_slider, 'sandwiches': sands_slider})
+
+display(ui, out)
@@ -0,0 +1,40 @@
+# @title 🍔 The Hungry Special & License Plates: Multiplication Rule (AND)
+import ipywidgets as widgets
+from IPython.display import display, HTML
+
+def update_and_rule(salads, sandwiches):
+    total = salads * sandwiches
+    display(HTML(f"""
+    <div style="border: 2px solid #1565C0; padding: 15px; border-radius: 10px; background-color: #e3f2fd; margin-bottom: 20px;">
+        <h4 style="color: #1565C0; margin-top:0;">Rule of Multiplication (AND)</h4>
+        <p>If you choose <b>1</b> item from <b>Set A</b> ({salads} options) <b>AND</b> <b>1</b> item from <b>Set B</b> ({sandwiches} options):</p>
+        <p style="font-size: 1.25em; font-weight: bold;">{salads} × {sandwiches} = <span style="color: #c62828;">{total} Possible Combinations</span></p>
+    </div>
+    """))
+
+def plate_calc(letters, numbers):
+    # Standard CT: 2 letters, 5 numbers
+    total = (26**letters) * (10**numbers)
+    display(HTML(f"""
+    <div style="border: 1px dashed #555; padding: 10px; border-radius: 5px; background-color: #fff;">
+        <b>License Plate Calculator:</b><br>
+        Pattern: {letters} Letters and {numbers} Numbers<br>
+        Calculation: 26<sup>{letters}</sup> × 10<sup>{numbers}</sup> = <span style="color: blue;">{total:,}</span> unique plates.
+    </div>
+    """))
+
+# Hungry Special Controls
+salads_s = widgets.IntSlider(value=4, min=1, max=10, description='Salads:')
+sands_s = widgets.IntSlider(value=5, min=1, max=10, description='Sandwiches:')
+
+# License Plate Controls
+let_s = widgets.Dropdown(options=[1,2,3], value=2, description='Letters:')
+num_s = widgets.Dropdown(options=[1,2,3,4,5,6], value=5, description='Numbers:')
+
+ui_hungry = widgets.VBox([widgets.Label("<b>Hungry Special (Salad AND Sandwich):</b>"), widgets.HBox([salads_s, sands_s])])
+out_hungry = widgets.interactive_output(update_and_rule, {'salads': salads_s, 'sandwiches': sands_s})
+
+ui_plate = widgets.VBox([widgets.Label("<b>License Plate Explorer:</b>"), widgets.HBox([let_s, num_s])])
+out_plate = widgets.interactive_output(plate_calc, {'letters': let_s, 'numbers': num_s})
+
+display(ui_hungry, out_hungry, ui_plate, out_plate)
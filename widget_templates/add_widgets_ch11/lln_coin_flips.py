@@ -0,0 +1,35 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+from IPython.display import display, clear_output
+
+def run_lln_simulation(n_trials=100):
+    # Simulate n_trials coin flips (0 for Tails, 1 for Heads)
+    flips = np.random.choice([0, 1], size=n_trials)
+    
+    # Calculate cumulative proportion of heads
+    cumulative_heads = np.cumsum(flips)
+    trials = np.arange(1, n_trials + 1)
+    proportions = cumulative_heads / trials
+    
+    # Plotting
+    plt.figure(figsize=(10, 6))
+    plt.plot(trials, proportions, label='Proportion of Heads', color='blue', linewidth=1)
+    plt.axhline(0.5, color='red', linestyle='--', label='Theoretical Probability (0.5)')
+    plt.ylim(0, 1)
+    plt.title(f'Law of Large Numbers: {n_trials} Coin Flips')
+    plt.xlabel('Number of Trials')
+    plt.ylabel('Proportion of Heads')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+    plt.show()
+
+# Interactive controls
+style = {'description_width': 'initial'}
+n_trials_slider = widgets.IntSlider(value=100, min=10, max=2000, step=10, description='Number of Trials:', style=style)
+
+ui = widgets.VBox([n_trials_slider])
+out = widgets.interactive_output(run_lln_simulation, {'n_trials': n_trials_slider})
+
+display(ui, out)
@@ -0,0 +1,41 @@
+
+import ipywidgets as widgets
+import math
+from IPython.display import display, HTML
+
+def calculate_counts(n, r):
+    # Validations
+    if r > n:
+        return "<div style='color:red;'><b>Error:</b> You cannot choose more items (r) than valid options (n).</div>"
+    
+    # Calculations
+    perm = math.perm(n, r)
+    comb = math.comb(n, r)
+    
+    # Formatting output with HTML for clarity
+    html_output = f"""
+    <div style="border: 1px solid #ddd; padding: 10px; border-radius: 5px; background-color: #f9f9f9;">
+        <h3>Results for n={n}, r={r}</h3>
+        <p><b>1. Fundamental Counting Principle (Permutations) - Order Matters:</b><br>
+        <i>Equation:</i> $P(n, r) = \frac{{n!}}{{(n-r)!}}$<br>
+        <i>Calculation:</i> {perm:,} different ways.</p>
+        <hr>
+        <p><b>2. Combinations - Order Does NOT Matter:</b><br>
+        <i>Equation:</i> $C(n, r) = \frac{{n!}}{{r!(n-r)!}}$<br>
+        <i>Calculation:</i> {comb:,} different ways.</p>
+        <hr>
+        <p><b>Key Insight:</b><br>
+        Permutations are always greater than or equal to Combinations because "AB" and "BA" count as two different permutations but only one combination.</p>
+    </div>
+    """
+    return HTML(html_output)
+
+# Interactive controls
+style = {'description_width': 'initial'}
+n_slider = widgets.IntSlider(value=5, min=1, max=20, step=1, description='Total Items (n):', style=style)
+r_slider = widgets.IntSlider(value=3, min=1, max=20, step=1, description='Items to Choose (r):', style=style)
+
+ui = widgets.VBox([n_slider, r_slider])
+out = widgets.interactive_output(calculate_counts, {'n': n_slider, 'r': r_slider})
+
+display(ui, out)
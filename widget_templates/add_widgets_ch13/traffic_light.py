@@ -0,0 +1,73 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+from IPython.display import display, clear_output
+
+def run_traffic_simulation(p_green, p_yellow, n_trials):
+    # Calculate P(Red) ensuring sum is 1.0 (handling float precision)
+    p_red = 1.0 - (p_green + p_yellow)
+    
+    if p_red < 0:
+        print("Error: Probabilities cannot sum to more than 1. Please reduce Green or Yellow.")
+        return
+
+    # Define states and probabilities
+    states = ['Green', 'Yellow', 'Red']
+    probs = [p_green, p_yellow, p_red]
+    colors = ['green', 'yellow', 'red']
+    
+    # Simulate
+    results = np.random.choice(states, size=n_trials, p=probs)
+    
+    # Count occurrences
+    counts = {state: np.sum(results == state) for state in states}
+    empirical_probs = [counts[s]/n_trials for s in states]
+    
+    # Plotting
+    plt.figure(figsize=(10, 6))
+    
+    # Theoretical Bars
+    plt.bar([x - 0.2 for x in range(3)], probs, width=0.4, label='Theoretical Probability', color='lightgray', alpha=0.8)
+    
+    # Empirical Bars
+    plt.bar([x + 0.2 for x in range(3)], empirical_probs, width=0.4, label=f'Observed Frequency (n={n_trials})', color=colors, alpha=0.7, edgecolor='black')
+    
+    plt.xticks(range(3), states)
+    plt.ylabel('Probability / Frequency')
+    plt.ylim(0, 1.0)
+    plt.title(f'Traffic Light Simulation: {n_trials} Trials')
+    plt.legend()
+    
+    # Text statistics
+    stats_text = (
+        f"Theoretical: G={p_green:.2f}, Y={p_yellow:.2f}, R={p_red:.2f} (Sum={sum(probs):.2f})\n"
+        f"Observed:    G={empirical_probs[0]:.2f}, Y={empirical_probs[1]:.2f}, R={empirical_probs[2]:.2f}"
+    )
+    plt.text(0.5, -0.15, stats_text, ha='center', transform=plt.gca().transAxes, fontsize=12, bbox=dict(facecolor='white', alpha=0.8))
+    
+    plt.grid(axis='y', alpha=0.3)
+    plt.show()
+
+# Controls
+style = {'description_width': 'initial'}
+p_green_slider = widgets.FloatSlider(value=0.35, min=0, max=1.0, step=0.05, description='P(Green):', style=style)
+p_yellow_slider = widgets.FloatSlider(value=0.05, min=0, max=1.0, step=0.05, description='P(Yellow):', style=style)
+n_trials_slider = widgets.IntSlider(value=100, min=10, max=1000, step=10, description='Number of Drivers:', style=style)
+
+def update_ui(change):
+    # Ensure P(Green) + P(Yellow) <= 1
+    if p_green_slider.value + p_yellow_slider.value > 1.0:
+        # Adjust yellow to fit if possible, or green
+        if change['owner'] == p_green_slider:
+            p_yellow_slider.value = max(0, 1.0 - p_green_slider.value)
+        else:
+            p_green_slider.value = max(0, 1.0 - p_yellow_slider.value)
+
+p_green_slider.observe(update_ui, names='value')
+p_yellow_slider.observe(update_ui, names='value')
+
+ui = widgets.VBox([p_green_slider, p_yellow_slider, n_trials_slider])
+out = widgets.interactive_output(run_traffic_simulation, {'p_green': p_green_slider, 'p_yellow': p_yellow_slider, 'n_trials': n_trials_slider})
+
+display(ui, out)
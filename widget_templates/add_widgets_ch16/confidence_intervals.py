@@ -0,0 +1,61 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+import scipy.stats as stats
+from IPython.display import display, clear_output
+
+def simulate_ci(n, p, confidence_level):
+    n_sims = 100
+    
+    # Generate simulations
+    # X ~ Binomial(n, p)
+    x = np.random.binomial(n, p, n_sims)
+    p_hats = x / n
+    
+    # Calculate intervals
+    z_score = stats.norm.ppf(1 - (1 - confidence_level)/2)
+    std_errors = np.sqrt(p_hats * (1 - p_hats) / n)
+    margins_of_error = z_score * std_errors
+    
+    lower_bounds = p_hats - margins_of_error
+    upper_bounds = p_hats + margins_of_error
+    
+    # Check capture
+    captured = (lower_bounds <= p) & (upper_bounds >= p)
+    capture_rate = np.mean(captured)
+    
+    # Plotting
+    plt.figure(figsize=(12, 6))
+    
+    # Plot intervals
+    for i in range(n_sims):
+        color = 'green' if captured[i] else 'red'
+        plt.plot([i, i], [lower_bounds[i], upper_bounds[i]], color=color, alpha=0.6)
+        plt.plot(i, p_hats[i], 'o', color=color, markersize=3)
+        
+    plt.axhline(p, color='black', linestyle='--', linewidth=2, label=f'True p = {p}')
+    
+    plt.title(f'Confidence Interval Simulation (n={n}, p={p}, Confidence={confidence_level:.0%})\nCapture Rate: {capture_rate:.0%}')
+    plt.xlabel('Simulation Number (1-100)')
+    plt.ylabel('Proportion')
+    plt.ylim(max(0, p - 0.2), min(1, p + 0.2))
+    plt.legend()
+    plt.grid(alpha=0.2)
+    
+    # Highlighting 'Red' intervals
+    if not all(captured):
+        plt.text(0.5, 0.05, f"Red lines missed the true parameter!", ha='center', transform=plt.gca().transAxes, color='red')
+        
+    plt.show()
+
+# Controls
+style = {'description_width': 'initial'}
+n_slider = widgets.IntSlider(value=50, min=10, max=500, step=10, description='Sample Size (n):', style=style)
+p_slider = widgets.FloatSlider(value=0.5, min=0.1, max=0.9, step=0.05, description='True Prop (p):', style=style)
+conf_dropdown = widgets.Dropdown(options=[0.90, 0.95, 0.99], value=0.95, description='Confidence Level:', style=style)
+
+ui = widgets.VBox([widgets.HBox([n_slider, p_slider]), conf_dropdown])
+out = widgets.interactive_output(simulate_ci, {'n': n_slider, 'p': p_slider, 'confidence_level': conf_dropdown})
+
+display(ui, out)
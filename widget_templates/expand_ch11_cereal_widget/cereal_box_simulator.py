@@ -0,0 +1,216 @@
+import ipywidgets as widgets
+from IPython.display import display, clear_output
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Most boxes simulate_collections() opens in one draw, across all the trials it is running.
+# A box costs a few bytes while it is drawn, so this caps the memory a simulation needs
+# however rare a picture is.
+MAX_BOXES_PER_DRAW = 2_000_000
+
+def simulate_collections(probs, n_trials, rng, max_boxes=MAX_BOXES_PER_DRAW):
+    """
+    Returns how many boxes each of n_trials students opened to complete the set, where
+    a box holds picture i with probability probs[i] (which must sum to 1).
+
+    Trials open a block of boxes at once, and for each picture we find the first box it
+    was in. A trial is complete at the latest of those first boxes. Trials still missing a
+    picture open another block. Trials run in chunks of at most max_boxes boxes per block.
+    """
+    probs = np.asarray(probs, dtype=float)
+    cum_probs = np.cumsum(probs)
+    n_pictures = len(probs)
+    # Long enough that about 1 trial in 1000 needs another block, but no longer than
+    # sum(1/p), which is at least the mean number of boxes, so a rare picture can't make
+    # every trial open thousands of boxes it doesn't need
+    tail = np.log(1e-3 / n_pictures) / np.log1p(-probs.min()) if probs.min() < 1 else 1
+    block = int(max(8, min(np.ceil(tail), np.ceil((1 / probs).sum()))))
+    chunk = max(1, max_boxes // block)
+
+    boxes_needed = np.empty(n_trials, dtype=np.int64)
+    for start in range(0, n_trials, chunk):
+        size = min(chunk, n_trials - start)
+        first_seen = np.full((size, n_pictures), -1, dtype=np.int64)
+        active = np.arange(size)
+        opened = 0
+        while len(active):
+            boxes = np.searchsorted(cum_probs, rng.random((len(active), block)), side='right')
+            np.minimum(boxes, n_pictures - 1, out=boxes)
+            seen = first_seen[active]
+            for code in range(n_pictures):
+                hits = boxes == code
+                new = (seen[:, code] < 0) & hits.any(axis=1)
+                seen[new, code] = opened + hits[new].argmax(axis=1)
+            first_seen[active] = seen
+
+            done = (seen >= 0).all(axis=1)
+            boxes_needed[start + active[done]] = seen[done].max(axis=1) + 1
+            active = active[~done]
+            opened += block
+    return boxes_needed
+
+class CerealBoxSimulator:
+    def __init__(self, athletes=None, probs=None, colors=None):
+        # Configuration: any number of pictures, each with its chance of being in a box
+        self.athletes = list(athletes) if athletes is not None else ['Simone Biles', 'Caitlin Clark', 'Serena Williams']
+        probs = np.asarray(probs if probs is not None else [0.2, 0.3, 0.5], dtype=float)
+        if len(probs) != len(self.athletes) or np.any(probs <= 0):
+            raise ValueError("Give one positive probability per athlete.")
+        self.probs = probs / probs.sum()
+        self.cum_probs = np.cumsum(self.probs)
+        self.colors = list(colors) if colors is not None else ['#d9534f', '#5cb85c', '#0275d8', '#f0ad4e', '#5bc0de', '#9b59b6'] # Red, Green, Blue match the text; extras for more athletes
+        self.rng = np.random.default_rng()
+        
+        # State associated with single trial
+        self.collection = {name: 0 for name in self.athletes}
+        self.boxes_opened = 0
+        self.history = [] # List of cards found in order
+        
+        # Simulation State
+        self.sim_results = []
+        
+        # UI Elements
+        self.out_display = widgets.Output()
+        self.out_plot = widgets.Output()
+        
+        self.btn_buy_one = widgets.Button(description="Buy 1 Box", button_style='info', icon='shopping-cart')
+        self.btn_buy_all = widgets.Button(description="Buy Until Full Set", button_style='warning', icon='fast-forward')
+        self.btn_reset = widgets.Button(description="Reset Collection", button_style='danger', icon='refresh')
+        
+        self.btn_sim_100 = widgets.Button(description="Simulate 100 Classes", button_style='success', icon='area-chart')
+        self.btn_sim_many = widgets.Button(description="Simulate 100,000 Classes", button_style='success',
+                                           icon='bar-chart', layout=widgets.Layout(width='220px'))
+        
+        # Layout
+        self.btn_buy_one.on_click(self.on_buy_one)
+        self.btn_buy_all.on_click(self.on_buy_all)
+        self.btn_reset.on_click(self.on_reset)
+        self.btn_sim_100.on_click(self.on_sim_100)
+        self.btn_sim_many.on_click(self.on_sim_many)
+        
+        self.controls = widgets.HBox([self.btn_buy_one, self.btn_buy_all, self.btn_reset])
+        self.sim_controls = widgets.HBox([self.btn_sim_100, self.btn_sim_many])
+        
+        odds = ", ".join(f"{name.split()[0]} {p:.0%}" for name, p in zip(self.athletes, self.probs))
+        self.dashboard = widgets.VBox([
+            widgets.HTML("<h3>Cereal Box Simulation</h3>"),
+            widgets.HTML(f"<p><strong>Goal:</strong> Collect all {len(self.athletes)} pictures ({odds})</p>"),
+            self.controls,
+            self.out_display,
+            widgets.HTML("<hr>"),
+            widgets.HTML("<h4>Class Simulation (Group Mode)</h4>"),
+            self.sim_controls,
+            self.out_plot
+        ])
+        
+        self.update_display()
+
+    def draw_boxes(self, shape):
+        """Opens boxes at random; each picture is an integer code into self.athletes."""
+        return np.searchsorted(self.cum_probs, self.rng.random(shape), side='right').clip(max=len(self.athletes) - 1)
+
+    def get_card(self):
+        return self.athletes[self.draw_boxes(1)[0]]
+
+    def on_buy_one(self, b):
+        card = self.get_card()
+        self.collection[card] += 1
+        self.boxes_opened += 1
+        self.history.append(card)
+        self.update_display()
+        
+    def on_buy_all(self, b):
+        # Limit to prevent infinite loops in weird cases, though unlikely here
+        limit = 100
+        while not all(self.collection.values()) and self.boxes_opened < limit:
+            self.on_buy_one(None)
+            
+    def on_reset(self, b):
+        self.collection = {name: 0 for name in self.athletes}
+        self.boxes_opened = 0
+        self.history = []
+        self.update_display()
+        
+    def simulate_classes(self, n_trials):
+        """Returns how many boxes each of n_trials students opened to complete the set."""
+        return simulate_collections(self.probs, n_trials, self.rng)
+
+    def run_full_trial(self):
+        # Helper for simulation: run until done and return count
+        return int(self.simulate_classes(1)[0])
+
+    def on_sim_100(self, b):
+        self.sim_results = self.simulate_classes(100)
+        self.update_plot()
+
+    def on_sim_many(self, b):
+        self.sim_results = self.simulate_classes(100_000)
+        self.update_plot()
+
+    def update_display(self):
+        with self.out_display:
+            clear_output(wait=True)
+            
+            # Status Banner
+            is_complete = all(self.collection.values())
+            status_color = "#dff0d8" if is_complete else "#f2dede"
+            status_text = "COLLECTION COMPLETE!" if is_complete else "Collection Incomplete"
+            
+            html = f'''
+            <div style="background-color: {status_color}; padding: 10px; border-radius: 5px; margin-top: 10px;">
+                <h4 style="margin-top:0;">Boxes Opened: {self.boxes_opened} | Status: {status_text}</h4>
+                <div style="display: flex; gap: 10px;">
+            '''
+            
+            for i, name in enumerate(self.athletes):
+                count = self.collection[name]
+                # visual style
+                opacity = "1.0" if count > 0 else "0.3"
+                border = f"3px solid {self.get_color(name)}" if count > 0 else "1px dashed #ccc"
+                
+                html += f'''
+                <div style="opacity: {opacity}; border: {border}; padding: 10px; border-radius: 8px; width: 120px; text-align: center; background-color: white;">
+                    <div style="font-size: 24px; color: {self.get_color(name)}; font-weight: bold;">{count}</div>
+                    <div style="font-size: 14px;">{name}</div>
+                    <div style="font-size: 10px; color: #777;">{round(self.probs[i]*100)}%</div>
+                </div>
+                '''
+            
+            html += "</div></div>"
+            display(widgets.HTML(html))
+            
+            # Show last few cards
+            if self.history:
+                recent = self.history[-10:]
+                history_html = "<div style='margin-top: 5px; color: #666;'>Recent: " + " &rarr; ".join([f"<span style='color:{self.get_color(c)}'>{c.split()[0]}</span>" for c in recent]) + "</div>"
+                display(widgets.HTML(history_html))
+
+    def get_color(self, name):
+        return self.colors[self.athletes.index(name) % len(self.colors)]
+
+    def update_plot(self):
+        with self.out_plot:
+            clear_output(wait=True)
+            if len(self.sim_results) == 0:
+                return
+            
+            avg = np.mean(self.sim_results)
+            med = np.median(self.sim_results)
+            # Count each number of boxes once instead of handing every trial to plt.hist
+            counts = np.bincount(self.sim_results)
+            low = int(self.sim_results.min())
+            
+            plt.figure(figsize=(10, 4))
+            plt.bar(np.arange(low, len(counts)), counts[low:], width=1.0, color='skyblue', edgecolor='white')
+            plt.axvline(avg, color='red', linestyle='dashed', linewidth=1, label=f'Mean: {avg:.1f}')
+            plt.axvline(med, color='green', linestyle='dashed', linewidth=1, label=f'Median: {med:.1f}')
+            plt.title(f'Distribution of Boxes Needed ({len(self.sim_results):,} Trials)')
+            plt.xlabel('Number of Boxes')
+            plt.ylabel('Frequency')
+            plt.legend()
+            plt.grid(axis='y', alpha=0.3)
+            plt.show()
+
+# Run the widget
+sim = CerealBoxSimulator()
+display(sim.dashboard)
@@ -0,0 +1,87 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import ListedColormap
+from IPython.display import display
+
+rng = np.random.default_rng()
+
+def run_lengths(heads):
+    """Lengths of the runs in a boolean sequence (True = Heads), in order."""
+    # A new run starts wherever a flip differs from the one before it
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(heads)) + 1, [len(heads)]])
+    return np.diff(starts)
+
+def longest_runs(n_sequences, n_flips):
+    """Longest run in each of n_sequences independent sequences of n_flips fair flips."""
+    heads = rng.random((n_sequences, n_flips)) < 0.5
+    # Run starts across the whole matrix: every row start, plus every change within a row
+    new_run = np.ones(heads.shape, dtype=bool)
+    new_run[:, 1:] = heads[:, 1:] != heads[:, :-1]
+    starts = np.flatnonzero(new_run.ravel())
+    lengths = np.diff(np.append(starts, heads.size))
+    # Runs are in row order, so the longest of each row's runs is one reduceat away
+    first_run_of_row = np.searchsorted(starts, np.arange(n_sequences) * n_flips)
+    return np.maximum.reduceat(lengths, first_run_of_row)
+
+def run_length_sim(n_flips=50):
+    # Simulate fair coin flips
+    heads = rng.random(n_flips) < 0.5
+
+    # Calculate Run Lengths
+    runs = run_lengths(heads)
+
+    # Monte Carlo: how long is the longest streak in many sequences of the same length?
+    n_sequences = 10_000
+    longest = longest_runs(n_sequences, n_flips)
+
+    # Plotting
+    fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(16, 5))
+
+    # Plot 1: The Sequence Grid
+    # Visualize flips as a grid of colored tiles, drawn as one image
+    cols = max(10, int(np.ceil(np.sqrt(n_flips / 2))))
+    rows = -(-n_flips // cols)
+    grid = np.full(rows * cols, np.nan)
+    grid[:n_flips] = heads
+    ax1.imshow(grid.reshape(rows, cols), cmap=ListedColormap(['orange', 'blue']), vmin=0, vmax=1,
+               extent=(0, cols, rows, 0), interpolation='nearest')
+    if n_flips <= 400:
+        # White lines between tiles
+        ax1.set_xticks(np.arange(cols + 1), minor=True)
+        ax1.set_yticks(np.arange(rows + 1), minor=True)
+        ax1.grid(which='minor', color='white', linewidth=2)
+    ax1.tick_params(which='both', length=0, labelbottom=False, labelleft=False)
+    for spine in ax1.spines.values():
+        spine.set_visible(False)
+    ax1.set_title(f"Sequence of {n_flips} Flips (Blue=H, Orange=T)")
+
+    # Plot 2: Histogram of Run Lengths
+    max_run = int(runs.max())
+    counts = np.bincount(runs, minlength=max_run + 1)[1:]
+    ax2.bar(np.arange(1, max_run + 1), counts, width=0.8, color='purple', alpha=0.7)
+    ax2.set_xticks(range(1, max_run+1) if max_run <= 20 else range(1, max_run + 1, max_run // 10 + 1))
+    ax2.set_xlabel('Run Length')
+    ax2.set_ylabel('Frequency')
+    ax2.set_title(f"Distribution of Streaks (Max Run: {max_run})")
+    ax2.grid(axis='y', alpha=0.3)
+
+    # Plot 3: Longest run over many sequences, with this sequence's longest marked
+    longest_counts = np.bincount(longest)
+    lengths = np.flatnonzero(longest_counts)
+    ax3.bar(lengths, longest_counts[lengths] / n_sequences, width=0.8, color='teal', alpha=0.7)
+    ax3.axvline(max_run, color='red', linestyle='--', label=f'Your sequence: {max_run}')
+    at_least = (longest >= max_run).mean()
+    ax3.set_xlabel('Longest Run in the Sequence')
+    ax3.set_ylabel('Proportion of Sequences')
+    ax3.set_title(f"Longest Streak in {n_sequences:,} Sequences of {n_flips}\n"
+                  f"{at_least:.0%} have a streak of {max_run} or more")
+    ax3.legend()
+    ax3.grid(axis='y', alpha=0.3)
+
+    plt.tight_layout()
+    plt.show()
+
+display(widgets.interactive(run_length_sim,
+                            n_flips=widgets.IntSlider(value=50, min=20, max=1000, step=10, description='Total Flips:')))
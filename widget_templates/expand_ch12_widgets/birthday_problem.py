@@ -0,0 +1,89 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+from IPython.display import display
+
+MAX_PEOPLE = 100  # at most 127: positions are packed into 7 bits below
+
+# Theoretical Calculation, once for every group size
+# P(No Match) = 365/365 * 364/365 * ... * (365-k+1)/365
+# EXACT_P_MATCH[k] is P(Match) for k people
+EXACT_P_MATCH = np.concatenate([[0.0], 1 - np.cumprod((365 - np.arange(MAX_PEOPLE)) / 365)])
+
+# Simulated P(Match) curves, keyed by number of simulated rooms
+_sim_curves = {}
+
+def first_match_sizes(n_rooms, rng):
+    """
+    Fills n_rooms rooms with MAX_PEOPLE random birthdays each and returns, for every room,
+    how many people had entered when two first shared a birthday (MAX_PEOPLE + 1 if none did).
+    """
+    birthdays = rng.integers(0, 365, size=(n_rooms, MAX_PEOPLE), dtype=np.int32)
+    # Sorting each row puts equal birthdays side by side. Each value also carries the
+    # person's arrival order (birthday * 128 + position), so the later arrival of an equal
+    # pair sorts second and its position is where a match appears.
+    ordered = np.sort(birthdays * 128 + np.arange(MAX_PEOPLE, dtype=np.int32), axis=1)
+    repeats = (ordered[:, 1:] >> 7) == (ordered[:, :-1] >> 7)
+    return np.where(repeats, ordered[:, 1:] & 127, MAX_PEOPLE).min(axis=1) + 1
+
+def simulated_curve(n_sims):
+    """Simulated P(Match) for every group size 0..MAX_PEOPLE, from n_sims rooms."""
+    if n_sims not in _sim_curves:
+        rng = np.random.default_rng()
+        counts = np.zeros(MAX_PEOPLE + 2, dtype=np.int64)
+        # In batches, so a million rooms don't need a gigabyte of memory
+        for start in range(0, n_sims, 50_000):
+            sizes = first_match_sizes(min(50_000, n_sims - start), rng)
+            counts += np.bincount(sizes, minlength=MAX_PEOPLE + 2)
+        # A room of k people has a match if the first match came with k or fewer people
+        _sim_curves[n_sims] = np.cumsum(counts)[:MAX_PEOPLE + 1] / n_sims
+    return _sim_curves[n_sims]
+
+def birthday_paradox_sim(k_people=23, n_sims=10_000):
+    prob_match = EXACT_P_MATCH[k_people]
+    sim_curve = simulated_curve(n_sims)
+    sim_prob = sim_curve[k_people]
+
+    # Visualization
+    fig, (ax, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    # Bar Chart comparison
+    bars = ax.bar(['Theoretical P(Match)', f'Simulated P(Match)\n(n={n_sims:,})'],
+           [prob_match, sim_prob], color=['skyblue', 'lightgreen'])
+
+    ax.set_ylim(0, 1.0)
+    ax.set_ylabel('Probability')
+    ax.set_title(f"The Birthday Problem (Group Size: {k_people})")
+
+    # Add labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height,
+                f'{height:.1%}', ha='center', va='bottom', fontsize=12, weight='bold')
+
+    # Threshold Line at 50%
+    ax.axhline(0.5, color='red', linestyle='--', alpha=0.5)
+    ax.text(0.5, 0.52, '50% Chance Threshold', color='red', ha='center')
+
+    # Every group size at once
+    sizes = np.arange(2, MAX_PEOPLE + 1)
+    ax2.plot(sizes, EXACT_P_MATCH[2:], color='steelblue', linewidth=2, label='Theoretical')
+    ax2.plot(sizes, sim_curve[2:], 'o', color='green', markersize=3, alpha=0.6, label=f'Simulated (n={n_sims:,})')
+    ax2.axvline(k_people, color='gray', linestyle=':')
+    ax2.axhline(0.5, color='red', linestyle='--', alpha=0.5)
+    ax2.set_xlim(2, MAX_PEOPLE)
+    ax2.set_ylim(0, 1.02)
+    ax2.set_xlabel('People in Room')
+    ax2.set_ylabel('P(Match)')
+    ax2.set_title('P(Match) for Every Group Size')
+    ax2.legend(loc='lower right')
+
+    plt.tight_layout()
+    plt.show()
+
+display(widgets.interactive(birthday_paradox_sim,
+                            k_people=widgets.IntSlider(value=23, min=2, max=MAX_PEOPLE, step=1, description='People in Room:'),
+                            n_sims=widgets.Dropdown(options=[('1,000', 1_000), ('10,000', 10_000), ('100,000', 100_000),
+                                                             ('1,000,000', 1_000_000)],
+                                                    value=10_000, description='Simulations:')))
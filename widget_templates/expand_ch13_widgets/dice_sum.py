@@ -0,0 +1,44 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+from IPython.display import display
+
+def dice_sim(n_rolls=100):
+    # Simulate rolling two dice
+    die1 = np.random.randint(1, 7, size=n_rolls)
+    die2 = np.random.randint(1, 7, size=n_rolls)
+    sums = die1 + die2
+    
+    # Analyze Frequency
+    values, counts = np.unique(sums, return_counts=True)
+    freqs = counts / n_rolls
+    
+    # Theoretical Probabilities
+    # Sums: 2(1/36), 3(2/36), 4(3/36), 5(4/36), 6(5/36), 7(6/36), ...
+    theoretical_probs = {
+        2: 1/36, 3: 2/36, 4: 3/36, 5: 4/36, 6: 5/36, 
+        7: 6/36, 8: 5/36, 9: 4/36, 10: 3/36, 11: 2/36, 12: 1/36
+    }
+    
+    # Plotting
+    plt.figure(figsize=(10, 6))
+    
+    # Bar Chart
+    possible_sums = np.arange(2, 13)
+    theory_vals = [theoretical_probs[s] for s in possible_sums]
+    
+    plt.bar(possible_sums - 0.2, theory_vals, width=0.4, label='Theoretical Probability', color='gray', alpha=0.6)
+    plt.bar(values + 0.2, freqs, width=0.4, label=f'Simulated (n={n_rolls})', color='blue', alpha=0.8)
+    
+    plt.xticks(possible_sums)
+    plt.xlabel('Sum of Two Dice')
+    plt.ylabel('Probability')
+    plt.title(f"Rolling Two Dice: Why is 7 Lucky?")
+    plt.legend()
+    plt.grid(axis='y', alpha=0.3)
+    
+    plt.show()
+
+display(widgets.interactive(dice_sim, 
+                            n_rolls=widgets.IntSlider(value=100, min=10, max=5000, step=10, description='Rolls:')))
@@ -0,0 +1,32 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+import scipy.stats as stats
+from IPython.display import display
+
+def plot_geometric(p=0.2):
+    # Geometric: P(X=k) = (1-p)^(k-1) * p
+    # Waiting until the k-th trial for the first success
+    
+    k_values = np.arange(1, 21)
+    probs = stats.geom.pmf(k_values, p)
+    
+    mean_wait = 1/p
+    
+    plt.figure(figsize=(10, 5))
+    bars = plt.bar(k_values, probs, color='orange', alpha=0.7)
+    
+    plt.title(f'Geometric Distribution (p={p})\nExpected Wait Time E(X) = 1/p = {mean_wait:.1f} trials')
+    plt.xlabel('Number of Trials to get First Success')
+    plt.ylabel('Probability')
+    plt.xticks(k_values)
+    plt.grid(axis='y', alpha=0.3)
+    
+    plt.axvline(mean_wait, color='blue', linestyle='--', label=f'Expected Wait ({mean_wait:.1f})')
+    plt.legend()
+    
+    plt.show()
+
+display(widgets.interactive(plot_geometric, 
+                            p=widgets.FloatSlider(value=0.2, min=0.05, max=0.9, step=0.05, description='Prob of Success (p):')))
@@ -0,0 +1,38 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+from IPython.display import display
+
+def plot_sample_size_demo(n):
+    # True Population: Mean=50, Std=15
+    pop_mean = 50
+    pop_std = 15
+    
+    # Generate one sample of size n
+    sample = np.random.normal(pop_mean, pop_std, n)
+    sample_mean = np.mean(sample)
+    
+    # Generate history of means for plot (to show "settling")
+    # We'll simulate increasing sample sizes up to n
+    ns = np.arange(1, n + 1)
+    # For speed, just plot the cumulative mean of this one large sample sequence
+    # This mimics "adding more people to the sample"
+    cumulative_means = np.cumsum(sample) / ns
+    
+    plt.figure(figsize=(10, 5))
+    plt.plot(ns, cumulative_means, label='Sample Mean', color='blue')
+    plt.axhline(pop_mean, color='red', linestyle='--', label=f'True Mean ({pop_mean})')
+    
+    plt.xlim(1, 1000)
+    plt.ylim(30, 70)
+    plt.xlabel('Sample Size (n)')
+    plt.ylabel('Average Value')
+    plt.title(f'Effect of Sample Size: Current Mean = {sample_mean:.2f} (n={n})')
+    plt.legend()
+    plt.grid(alpha=0.3)
+    
+    plt.show()
+
+display(widgets.interactive(plot_sample_size_demo, 
+                            n=widgets.IntSlider(value=10, min=2, max=1000, step=10, description='Sample Size:')))
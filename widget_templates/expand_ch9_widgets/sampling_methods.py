@@ -0,0 +1,104 @@
+
+import ipywidgets as widgets
+import matplotlib.pyplot as plt
+import numpy as np
+import matplotlib.patches as patches
+
+def plot_sampling_method(method):
+    # Population: 10x10 Grid
+    # Setup Strata: Left half (Red), Right half (Blue)
+    # Setup Clusters: 4 quadrants (Top-Left, Top-Right, Bot-Left, Bot-Right)
+    
+    n_points = 100
+    cols = 10
+    rows = 10
+    
+    x = np.tile(np.arange(cols), rows)
+    y = np.repeat(np.arange(rows), cols)
+    colors = ['red' if c < 5 else 'blue' for c in x] # Strata colors
+    
+    fig, ax = plt.subplots(figsize=(8, 8))
+    
+    # Base Plot: All points faded
+    ax.scatter(x, y, c=colors, s=50, alpha=0.2)
+    
+    start_idx = 0 # For systematic
+    
+    selected_indices = []
+    
+    if method == 'Simple Random Sample (SRS)':
+        # Pick 20 random points
+        selected_indices = np.random.choice(range(n_points), 20, replace=False)
+        title = "SRS: Every individual has equal chance."
+        
+    elif method == 'Stratified':
+        # Pick 10 from Red (Left), 10 from Blue (Right)
+        red_indices = [i for i, c in enumerate(x) if c < 5]
+        blue_indices = [i for i, c in enumerate(x) if c >= 5]
+        sel_red = np.random.choice(red_indices, 10, replace=False)
+        sel_blue = np.random.choice(blue_indices, 10, replace=False)
+        selected_indices = np.concatenate([sel_red, sel_blue])
+        title = "Stratified: Slice population into groups (Strata), sample from EACH group."
+        
+        # Draw Divider
+        ax.axvline(4.5, color='black', linestyle='--')
+        ax.text(2, -1, "Stratum 1", ha='center')
+        ax.text(7, -1, "Stratum 2", ha='center')
+
+    elif method == 'Cluster':
+        # Clusters: 0:TL, 1:TR, 2:BL, 3:BR. Pick 1 random cluster.
+        # TL: x<5, y>=5. TR: x>=5, y>=5. BL: x<5, y<5. BR: x>=5, y<5
+        clusters = {0: [], 1: [], 2: [], 3: []}
+        for i in range(n_points):
+            if x[i]<5 and y[i]>=5: clusters[0].append(i)
+            elif x[i]>=5 and y[i]>=5: clusters[1].append(i)
+            elif x[i]<5 and y[i]<5: clusters[2].append(i)
+            elif x[i]>=5 and y[i]<5: clusters[3].append(i)
+            
+        chosen_cluster = np.random.choice([0, 1, 2, 3])
+        selected_indices = clusters[chosen_cluster]
+        title = "Cluster: Split into groups, pick the WHOLE group."
+        
+        # Draw Cluster boxes
+        rects = [
+            patches.Rectangle((-0.5, 4.5), 5, 5, fill=False, edgecolor='green', lw=2), # TL
+            patches.Rectangle((4.5, 4.5), 5, 5, fill=False, edgecolor='green', lw=2),  # TR
+            patches.Rectangle((-0.5, -0.5), 5, 5, fill=False, edgecolor='green', lw=2),# BL
+            patches.Rectangle((4.5, -0.5), 5, 5, fill=False, edgecolor='green', lw=2)  # BR
+        ]
+        # Highlight chosen
+        rects[chosen_cluster].set_edgecolor('black')
+        rects[chosen_cluster].set_linewidth(4)
+        for r in rects: ax.add_patch(r)
+
+    elif method == 'Systematic':
+        # Pick every 5th person
+        start = np.random.randint(0, 5)
+        selected_indices = np.arange(start, n_points, 5)
+        title = f"Systematic: Start at {start}, pick every 5th person."
+        
+        # Draw path
+        # Connect dots to show order? Maybe too messy.
+        
+    # Plot Selected (Dark Mode)
+    if len(selected_indices) > 0:
+        sel_x = x[selected_indices]
+        sel_y = y[selected_indices]
+        sel_c = np.array(colors)[selected_indices]
+        ax.scatter(sel_x, sel_y, c=sel_c, s=150, edgecolor='black', zorder=10)
+    
+    ax.set_title(title, fontsize=12)
+    ax.axis('off')
+    plt.show()
+
+# Dropdown
+style = {'description_width': 'initial'}
+method_dropdown = widgets.Dropdown(
+    options=['Simple Random Sample (SRS)', 'Stratified', 'Cluster', 'Systematic'],
+    value='Simple Random Sample (SRS)',
+    description='Method:',
+    style=style,
+    layout={'width': '400px'}
+)
+
+display(widgets.interactive(plot_sampling_method, method=method_dropdown))
@@ -0,0 +1,197 @@
+import ipywidgets as widgets
+from IPython.display import display, clear_output
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Trials per simulation. Every mode draws all of them in one NumPy call.
+N_TRIALS = 1_000_000
+# A 100% shooter never misses; streaks stop here instead of running forever
+MAX_STREAK = 100
+
+class FreeThrowSimulator:
+    def __init__(self):
+        # Config
+        self.accuracy = 80
+        self.mode = 'streak' # 'streak' (geo), 'set5' (binom), '1and1'
+        
+        # UI Elements
+        self.out_display = widgets.Output()
+        self.out_plot = widgets.Output()
+        
+        # Controls
+        self.sld_accuracy = widgets.IntSlider(value=80, min=50, max=100, step=1, description='Accuracy %')
+        self.dd_mode = widgets.Dropdown(
+            options=[
+                ('Shoot until Miss (Streak)', 'streak'), 
+                ('Set of 5 Shots', 'set5'), 
+                ('1-and-1 Foul Shot', '1and1')
+            ],
+            value='streak',
+            description='Scenario:'
+        )
+        
+        self.btn_shoot = widgets.Button(description="Shoot!", button_style='warning', icon='basketball-ball')
+        self.btn_sim = widgets.Button(description=f"Simulate {N_TRIALS:,} Trials", button_style='success',
+                                      icon='fast-forward', layout=widgets.Layout(width='220px'))
+        
+        self.sld_accuracy.observe(self.on_config_change, names='value')
+        self.dd_mode.observe(self.on_mode_change, names='value')
+        self.btn_shoot.on_click(self.on_shoot)
+        self.btn_sim.on_click(self.on_simulate)
+        
+        # State
+        self.rng = np.random.default_rng()
+        self.last_result = None
+        self.sim_results = np.array([], dtype=int)
+        
+        self.dashboard = widgets.VBox([
+            widgets.HTML("<h3>🏀 Interactive Free Throw Lab</h3>"),
+            widgets.HBox([self.dd_mode, self.sld_accuracy]),
+            widgets.HTML("<hr>"),
+            widgets.HBox([self.btn_shoot, self.btn_sim]),
+            self.out_display,
+            self.out_plot
+        ])
+        
+        self.update_display()
+
+    def on_config_change(self, change):
+        self.accuracy = self.sld_accuracy.value
+        self.last_result = None
+        self.sim_results = np.array([], dtype=int)
+        self.out_plot.clear_output()
+        self.update_display()
+
+    def on_mode_change(self, change):
+        self.mode = self.dd_mode.value
+        self.last_result = None
+        self.sim_results = np.array([], dtype=int)
+        self.out_plot.clear_output() # Clear plot on mode switch to avoid confusion
+        self.update_display()
+
+    def make_shot(self):
+        return np.random.rand() < (self.accuracy / 100.0)
+
+    def simulate_trials(self, n):
+        """Runs n trials of the current scenario at once and returns their results as an array."""
+        prob = self.accuracy / 100.0
+        
+        if self.mode == 'streak':
+            # Makes before the first miss: geometric() counts shots up to and including the miss
+            if prob >= 1.0:
+                return np.full(n, MAX_STREAK)
+            return np.minimum(self.rng.geometric(1.0 - prob, size=n) - 1, MAX_STREAK)
+            
+        elif self.mode == 'set5':
+            return self.rng.binomial(5, prob, size=n)
+            
+        elif self.mode == '1and1':
+            # 1-and-1 logic:
+            # First shot: If miss -> 0 pts. If make -> Earn 2nd shot.
+            # Second shot: If miss -> 1 pt. If make -> 2 pts.
+            first = self.rng.random(n) < prob
+            second = self.rng.random(n) < prob
+            return first * (1 + second)
+
+    def run_trial(self):
+        return int(self.simulate_trials(1)[0])
+
+    def on_shoot(self, b):
+        # Visual single trial
+        prob = self.accuracy / 100.0
+        
+        if self.mode == 'streak':
+            makes = 0
+            history = []
+            while len(history) < MAX_STREAK:
+                is_make = np.random.rand() < prob
+                history.append(is_make)
+                if is_make: makes += 1
+                else: break
+            self.last_result = {'type': 'streak', 'makes': makes, 'history': history}
+            
+        elif self.mode == 'set5':
+            history = [np.random.rand() < prob for _ in range(5)]
+            self.last_result = {'type': 'set5', 'makes': sum(history), 'history': history}
+            
+        elif self.mode == '1and1':
+            history = []
+            pts = 0
+            # Shot 1
+            s1 = np.random.rand() < prob
+            history.append(s1)
+            if s1:
+                # Shot 2
+                s2 = np.random.rand() < prob
+                history.append(s2)
+                pts = 2 if s2 else 1
+            else:
+                pts = 0
+                
+            self.last_result = {'type': '1and1', 'pts': pts, 'history': history}
+            
+        self.update_display()
+
+    def on_simulate(self, b):
+        self.sim_results = self.simulate_trials(N_TRIALS)
+        self.update_plot()
+        
+    def update_display(self):
+        with self.out_display:
+            clear_output(wait=True)
+            
+            if self.last_result:
+                r = self.last_result
+                html = "<div style='font-size: 1.2em; margin-top:10px;'>"
+                
+                # Visual balls
+                balls = ""
+                for h in r['history']:
+                    if h: balls += "🟢 "
+                    else: balls += "🔴 "
+                
+                if r['type'] == 'streak':
+                    html += f"Result: <strong>{r['makes']} Makes</strong> in a row.<br>{balls}"
+                elif r['type'] == 'set5':
+                    html += f"Result: <strong>{r['makes']} / 5</strong> Made.<br>{balls}"
+                elif r['type'] == '1and1':
+                    html += f"Result: <strong>{r['pts']} Points</strong>.<br>{balls}"
+                
+                html += "</div>"
+                display(widgets.HTML(html))
+
+    def update_plot(self):
+        with self.out_plot:
+            clear_output(wait=True)
+            if len(self.sim_results) == 0: return
+            
+            plt.figure(figsize=(8, 4))
+            
+            # Bins depend on mode
+            if self.mode == 'streak':
+                # Geometric can be long, clip at 15 for viz
+                counts = np.bincount(np.minimum(self.sim_results, 15))
+                plt.bar(np.arange(len(counts)), counts, width=1.0, color='#d35400', alpha=0.7, edgecolor='white')
+                plt.xlabel("Shots Made Before Miss")
+                if len(counts) == 16:
+                    plt.xticks(range(0, 16, 5), ['0', '5', '10', '15+'])
+                
+            elif self.mode == 'set5':
+                counts = np.bincount(self.sim_results, minlength=6)
+                plt.bar(range(6), counts, width=1.0, color='#e67e22', alpha=0.7, edgecolor='white')
+                plt.xlabel("Shots Made out of 5")
+                plt.xticks(range(6))
+                
+            elif self.mode == '1and1':
+                counts = np.bincount(self.sim_results, minlength=3)
+                plt.bar(range(3), counts, width=1.0, color='#f39c12', alpha=0.7, edgecolor='white')
+                plt.xlabel("Points Scored (0, 1, or 2)")
+                plt.xticks([0, 1, 2])
+            
+            plt.title(f"Distribution of {len(self.sim_results):,} Trials (Acc: {self.accuracy}%)")
+            plt.ylabel("Frequency")
+            plt.show()
+
+# Run
+ft_sim = FreeThrowSimulator()
+display(ft_sim.dashboard)
@@ -0,0 +1,109 @@
+import ipywidgets as widgets
+from IPython.display import display, clear_output
+import numpy as np
+import matplotlib.pyplot as plt
+
+class DormLotterySimulator:
+    def __init__(self):
+        # Configuration
+        self.total_students = 57
+        self.num_athletes = 20
+        self.spots = 3
+        
+        # Simulation State
+        self.results = [] # Store count of athletes in each trial (0, 1, 2, or 3)
+        self.current_winners = []
+        
+        # UI Elements
+        self.out_display = widgets.Output()
+        self.out_plot = widgets.Output()
+        
+        self.btn_draw = widgets.Button(description="Run 1 Lottery", button_style='info', icon='ticket')
+        self.btn_sim_1000 = widgets.Button(description="Simulate 1000 Lotteries", button_style='success', icon='fast-forward')
+        self.btn_reset = widgets.Button(description="Reset Stats", button_style='warning', icon='refresh')
+        
+        self.btn_draw.on_click(self.on_draw)
+        self.btn_sim_1000.on_click(self.on_sim_1000)
+        self.btn_reset.on_click(self.on_reset)
+        
+        self.dashboard = widgets.VBox([
+            widgets.HTML("<h3>🎫 Interactive Lottery Simulator</h3>"),
+            widgets.HTML(f"<p>Draw <strong>{self.spots}</strong> winners from <strong>{self.total_students}</strong> students ({self.num_athletes} Athletes).</p>"),
+            widgets.HBox([self.btn_draw, self.btn_reset]),
+            self.out_display,
+            widgets.HTML("<hr>"),
+            self.btn_sim_1000,
+            self.out_plot
+        ])
+        
+        self.update_display()
+
+    def run_lottery(self):
+        # Create pool: 1=Athlete, 0=Non-Athlete
+        pool = [1]*self.num_athletes + [0]*(self.total_students - self.num_athletes)
+        # Draw without replacement
+        winners = np.random.choice(pool, size=self.spots, replace=False)
+        return winners
+
+    def on_draw(self, b):
+        self.current_winners = self.run_lottery()
+        athlete_count = sum(self.current_winners)
+        self.results.append(athlete_count)
+        self.update_display()
+
+    def on_sim_1000(self, b):
+        new_results = [sum(self.run_lottery()) for _ in range(1000)]
+        self.results.extend(new_results)
+        self.current_winners = []
+        self.update_display()
+        self.update_plot()
+
+    def on_reset(self, b):
+        self.results = []
+        self.current_winners = []
+        self.out_plot.clear_output()
+        self.update_display()
+
+    def update_display(self):
+        with self.out_display:
+            clear_output(wait=True)
+            
+            # Show last draw if exists
+            if len(self.current_winners) > 0:
+                html_draw = '<div style="margin: 10px 0; font-size: 1.1em;">Last Draw: '
+                for is_athlete in self.current_winners:
+                    if is_athlete:
+                        html_draw += '<span style="background:#ffeeba; border:1px solid #ffdf7e; padding:3px 8px; border-radius:10px; margin-right:5px;">🏃 Athlete</span>'
+                    else:
+                        html_draw += '<span style="background:#e2e3e5; border:1px solid #dae0e5; padding:3px 8px; border-radius:10px; margin-right:5px;">🎓 Student</span>'
+                html_draw += '</div>'
+                display(widgets.HTML(html_draw))
+                
+                if sum(self.current_winners) == 3:
+                    display(widgets.HTML('<div style="color:red; font-weight:bold;">⚠️ ALL ATHLETES! (Suspicious?)</div>'))
+
+    def update_plot(self):
+        with self.out_plot:
+            clear_output(wait=True)
+            if not self.results: return
+            
+            counts = [self.results.count(i) for i in range(4)]
+            total = len(self.results)
+            
+            plt.figure(figsize=(8, 4))
+            bars = plt.bar(['0 Athletes', '1 Athlete', '2 Athletes', '3 Athletes'], counts, color=['#e2e3e5', '#badce3', '#ffeeba', '#f5c6cb'])
+            
+            # Add percentages
+            for bar, count in zip(bars, counts):
+                if count > 0:
+                    plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(), f'{count/total:.1%}', 
+                             ha='center', va='bottom', fontweight='bold')
+            
+            plt.title(f"Outcomes of {total} Simulated Lotteries")
+            plt.ylabel("Frequency")
+            plt.grid(axis='y', alpha=0.3)
+            plt.show()
+
+# Run
+lottery_sim = DormLotterySimulator()
+display(lottery_sim.dashboard)
@@ -0,0 +1,189 @@
+import ipywidgets as widgets
+from IPython.display import display, clear_output
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Series are simulated in batches of this many, so a million series never needs more than
+# a few MB of memory at once
+SERIES_BATCH = 250_000
+
+class WorldSeriesSimulator:
+    def __init__(self):
+        # Config
+        self.home_win_prob = 0.55
+        self.schedule = ['Philly', 'Philly', 'Boston', 'Boston', 'Boston', 'Philly', 'Philly']
+        self.phi_home = np.array([loc == 'Philly' for loc in self.schedule])
+        self.rng = np.random.default_rng()
+        
+        # State
+        self.wins_phi = 0
+        self.wins_bos = 0
+        self.current_game = 0
+        self.game_log = []
+        self.sim_results = None # (phillies_won, series_length) arrays from the last mass sim
+        
+        # UI
+        self.out_display = widgets.Output()
+        self.out_plot = widgets.Output()
+        
+        self.btn_play = widgets.Button(description="Play Next Game", button_style='info', icon='play')
+        self.btn_reset = widgets.Button(description="Reset Series", button_style='warning', icon='refresh')
+        self.btn_sim_1000 = widgets.Button(description="Simulate 1000 Series", button_style='success', icon='fast-forward')
+        self.btn_sim_million = widgets.Button(description="Simulate 1,000,000 Series", button_style='success',
+                                              icon='forward', layout=widgets.Layout(width='220px'))
+        
+        self.btn_play.on_click(self.on_play_game)
+        self.btn_reset.on_click(self.on_reset)
+        self.btn_sim_1000.on_click(self.on_sim_1000)
+        self.btn_sim_million.on_click(self.on_sim_million)
+        
+        self.controls = widgets.HBox([self.btn_play, self.btn_reset])
+        
+        self.dashboard = widgets.VBox([
+            widgets.HTML("<h3>⚾ Interactive World Series Simulator</h3>"),
+            widgets.HTML(f"<p><strong>Rules:</strong> Best of 7. Home team has {int(self.home_win_prob*100)}% win chance.</p>"),
+            self.controls,
+            self.out_display,
+            widgets.HTML("<hr>"),
+            widgets.HBox([self.btn_sim_1000, self.btn_sim_million]),
+            self.out_plot
+        ])
+        
+        self.update_display()
+
+    def play_game_logic(self):
+        if self.wins_phi >= 4 or self.wins_bos >= 4:
+            return None
+            
+        loc = self.schedule[self.current_game]
+        home_team = 'Phillies' if loc == 'Philly' else 'Red Sox'
+        
+        # Random roll
+        roll = np.random.rand()
+        
+        if roll < self.home_win_prob:
+            winner = home_team
+        else:
+            winner = 'Red Sox' if home_team == 'Phillies' else 'Phillies'
+            
+        return {'game': self.current_game + 1, 'loc': loc, 'winner': winner}
+
+    def on_play_game(self, b):
+        res = self.play_game_logic()
+        if res:
+            self.current_game += 1
+            if res['winner'] == 'Phillies': self.wins_phi += 1
+            else: self.wins_bos += 1
+            self.game_log.append(res)
+            self.update_display()
+
+    def on_reset(self, b):
+        self.wins_phi = 0
+        self.wins_bos = 0
+        self.current_game = 0
+        self.game_log = []
+        self.update_display()
+
+    def simulate_series(self, n):
+        """
+        Plays n whole series at once. Each row of an (n, 7) matrix holds one series' games
+        on the 2-3-2 schedule; games after the series is decided are drawn but ignored.
+        Returns (phillies_won, series_length) arrays.
+        """
+        home_wins = self.rng.random((n, 7)) < self.home_win_prob
+        # The Phillies win a game when they're home and the home team wins, or away and it loses
+        phi_game_wins = home_wins == self.phi_home
+        phi_total = np.cumsum(phi_game_wins, axis=1, dtype=np.int8)
+        bos_total = np.arange(1, 8, dtype=np.int8) - phi_total
+        # A series ends at the first game where either team reaches 4 wins
+        series_length = np.argmax((phi_total == 4) | (bos_total == 4), axis=1) + 1
+        phillies_won = phi_total[np.arange(n), series_length - 1] == 4
+        return phillies_won, series_length
+
+    def run_full_series(self):
+        phillies_won, _ = self.simulate_series(1)
+        return 'Phillies' if phillies_won[0] else 'Red Sox'
+
+    def run_many_series(self, n):
+        batches = [self.simulate_series(min(SERIES_BATCH, n - start)) for start in range(0, n, SERIES_BATCH)]
+        return np.concatenate([b[0] for b in batches]), np.concatenate([b[1] for b in batches])
+
+    def on_sim_1000(self, b):
+        self.show_simulation(1000)
+
+    def on_sim_million(self, b):
+        self.show_simulation(1_000_000)
+
+    def show_simulation(self, n):
+        phillies_won, series_length = self.run_many_series(n)
+        self.sim_results = (phillies_won, series_length)
+        phi_wins = int(phillies_won.sum())
+        # Series lengths 4-7, split by winner
+        phi_lengths = np.bincount(series_length[phillies_won], minlength=8)[4:]
+        bos_lengths = np.bincount(series_length[~phillies_won], minlength=8)[4:]
+        
+        with self.out_plot:
+            clear_output(wait=True)
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 4))
+            ax1.bar(['Phillies', 'Red Sox'], [phi_wins, n - phi_wins], color=['#d9534f', '#002f6c'])
+            ax1.set_title(f"{n:,} Simulated Series (Phi Wins: {100 * phi_wins / n:.1f}%)")
+            ax1.set_ylabel("Series Won")
+            ax1.grid(axis='y', alpha=0.3)
+            
+            games = np.arange(4, 8)
+            ax2.bar(games, phi_lengths, color='#d9534f', label='Phillies win')
+            ax2.bar(games, bos_lengths, bottom=phi_lengths, color='#002f6c', label='Red Sox win')
+            for g, total in zip(games, phi_lengths + bos_lengths):
+                ax2.text(g, total, f"{100 * total / n:.1f}%", ha='center', va='bottom')
+            ax2.set_title("How Many Games Did the Series Last?")
+            ax2.set_xlabel("Games Played")
+            ax2.set_ylabel("Number of Series")
+            ax2.set_xticks(games)
+            ax2.legend()
+            ax2.grid(axis='y', alpha=0.3)
+            plt.tight_layout()
+            plt.show()
+
+    def update_display(self):
+        with self.out_display:
+            clear_output(wait=True)
+            
+            # Series Scoreboard
+            html = f'''
+            <div style="display: flex; gap: 20px; align-items: center; margin: 10px 0;">
+                <div style="text-align: center;">
+                    <h2 style="margin:0; color: #d9534f;">{self.wins_phi}</h2>
+                    <div>Phillies</div>
+                </div>
+                <div style="font-size: 1.5em; color: #777;">-</div>
+                <div style="text-align: center;">
+                    <h2 style="margin:0; color: #002f6c;">{self.wins_bos}</h2>
+                    <div>Red Sox</div>
+                </div>
+            </div>
+            '''
+            
+            # Game Log Table
+            if self.game_log:
+                rows = ""
+                for g in self.game_log:
+                     winner_style = "font-weight:bold; color: #d9534f" if g['winner'] == 'Phillies' else "font-weight:bold; color: #002f6c"
+                     rows += f"<tr><td>{g['game']}</td><td>{g['loc']}</td><td style='{winner_style}'>{g['winner']}</td></tr>"
+                
+                html += f'''
+                <table class="table" style="width: 50%; border: 1px solid #ddd; margin-top: 10px;">
+                    <thead style="background-color: #f5f5f5;"><tr><th>Game</th><th>Location</th><th>Winner</th></tr></thead>
+                    <tbody>{rows}</tbody>
+                </table>
+                '''
+                
+            if self.wins_phi == 4:
+                html += "<div style='color: #d9534f; font-weight: bold; margin-top: 10px;'>🏆 PHILLIES WIN THE WORLD SERIES!</div>"
+            elif self.wins_bos == 4:
+                html += "<div style='color: #002f6c; font-weight: bold; margin-top: 10px;'>🏆 RED SOX WIN THE WORLD SERIES!</div>"
+                
+            display(widgets.HTML(html))
+
+# Run
+ws_sim = WorldSeriesSimulator()
+display(ws_sim.dashboard)